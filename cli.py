@@ -0,0 +1,92 @@
+"""
+Single entry point for the demos and the import-time budget check.
+
+Usage (from the repository root):
+    python -m cli list
+    python -m cli demo flows.edmonds_karp
+    python -m cli import-time [--budget-ms 30]
+"""
+import argparse
+import json
+import pkgutil
+import runpy
+import subprocess
+import sys
+
+PACKAGES = ('flows', 'matchings', 'lca_rmq')
+
+# Modules whose core data structures are numpy arrays; every other module
+# must import without pulling numpy in.
+NUMPY_MODULES = {'matchings.hungarian'}
+
+DEFAULT_IMPORT_BUDGET_MS = 30.0
+
+_PROBE = """
+import contextlib, io, json, sys, time
+buffer = io.StringIO()
+start = time.perf_counter()
+with contextlib.redirect_stdout(buffer):
+    __import__({module!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'numpy': 'numpy' in sys.modules,
+                  'stdout': len(buffer.getvalue())}}))
+"""
+
+def iter_modules():
+    for package in PACKAGES:
+        path = __import__(package).__path__
+        for info in pkgutil.iter_modules(path):
+            if not info.ispkg:
+                yield f"{package}.{info.name}"
+
+def measure_import(module):
+    # A fresh interpreter per module, so nothing is already cached in sys.modules
+    output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def check_import_time(budget_ms):
+    failures = 0
+    for module in iter_modules():
+        if module.rpartition('.')[2].startswith('benchmark_'):
+            # Benchmarks are scripts, never imported by worker code
+            continue
+        report = measure_import(module)
+        problems = []
+        if module in NUMPY_MODULES:
+            status = 'ok (numpy, not budgeted)'
+        else:
+            if report['ms'] > budget_ms:
+                problems.append(f"over budget ({budget_ms:.0f} ms)")
+            if report['numpy']:
+                problems.append("imports numpy eagerly")
+            status = 'ok'
+        if report['stdout']:
+            problems.append("prints on import")
+        failures += bool(problems)
+        print(f"{module:<40} {report['ms']:8.2f} ms  {'; '.join(problems) or status}")
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cli', description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help='list runnable modules')
+    demo = commands.add_parser('demo', help="run a module's example")
+    demo.add_argument('module')
+    budget = commands.add_parser('import-time', help='check import time and side effects of every module')
+    budget.add_argument('--budget-ms', type=float, default=DEFAULT_IMPORT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for module in iter_modules():
+            print(module)
+        return 0
+    if args.command == 'demo':
+        if args.module not in set(iter_modules()):
+            parser.error(f"unknown module {args.module!r}; see 'python -m cli list'")
+        runpy.run_module(args.module, run_name='__main__', alter_sys=True)
+        return 0
+    return 1 if check_import_time(args.budget_ms) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
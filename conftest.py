@@ -0,0 +1,2 @@
+# Puts the repository root on sys.path, so plain `pytest` imports flows, matchings
+# and lca_rmq the same way `python -m pytest` does
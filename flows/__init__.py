@@ -0,0 +1 @@
+"""Maximum flow, minimum cost flow, cut and greedy matching algorithms."""
@@ -0,0 +1,52 @@
+import random
+import time
+
+from .edmonds_karp import ResidualGraph, edmonds_karp_ids
+from .capacity_scaling import capacity_scaling_ids
+
+def skewed_network(n_layers, width, degree, seed=0):
+    # Слоистая сеть, способности распределены лог-равномерно от 1 до 10^12
+    rng = random.Random(seed)
+    edges = []
+    source, sink = 0, 1
+    layer_nodes = [[2 + layer * width + i for i in range(width)] for layer in range(n_layers)]
+
+    def capacity():
+        return int(10 ** rng.uniform(0, 12))
+
+    for v in layer_nodes[0]:
+        edges.append((source, v, capacity()))
+    for layer in range(n_layers - 1):
+        for u in layer_nodes[layer]:
+            for v in rng.sample(layer_nodes[layer + 1], degree):
+                edges.append((u, v, capacity()))
+    for u in layer_nodes[-1]:
+        edges.append((u, sink, capacity()))
+
+    return 2 + n_layers * width, edges, source, sink
+
+def run(solver, n, edges, source, sink):
+    residual = ResidualGraph(n, edges)
+    augmentations = 0
+    original_augment = residual.augment
+
+    def counting_augment(s, t):
+        nonlocal augmentations
+        augmentations += 1
+        return original_augment(s, t)
+
+    residual.augment = counting_augment
+    start = time.perf_counter()
+    value = solver(residual, source, sink)
+    return value, augmentations, time.perf_counter() - start
+
+if __name__ == "__main__":
+    solvers = [('edmonds_karp', edmonds_karp_ids), ('capacity_scaling', capacity_scaling_ids)]
+
+    for n_layers, width, degree in [(5, 20, 4), (10, 50, 5), (15, 80, 5)]:
+        n, edges, source, sink = skewed_network(n_layers, width, degree)
+        print(f"Сеть: {n} вершин, {len(edges)} рёбер")
+        for name, solver in solvers:
+            value, augmentations, elapsed = run(solver, n, edges, source, sink)
+            print(f"  {name:>16}: поток = {value}, дополнений = {augmentations}, "
+                  f"время = {elapsed:.3f} с")
@@ -0,0 +1,40 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from .greedy_matching import (greedy_maximal_matching, greedy_maximal_matching_stream,
+                              randomized_maximal_matching)
+
+def is_maximal_matching(num_vertices, edges, matching):
+    covered = np.zeros(num_vertices, dtype=np.int64)
+    np.add.at(covered, matching.ravel(), 1)
+    if covered.max(initial=0) > 1:
+        return False
+    u, v = edges[:, 0], edges[:, 1]
+    return bool(np.all((u == v) | (covered[u] > 0) | (covered[v] > 0)))
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    num_edges = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000_000
+    rng = np.random.default_rng(0)
+    edges = rng.integers(0, num_vertices, size=(num_edges, 2), dtype=np.int64)
+    print(f"Random graph: n = {num_vertices}, m = {num_edges}, cpu count = {os.cpu_count()}")
+
+    edge_list = [tuple(e) for e in edges.tolist() if e[0] != e[1]]
+    sequential, elapsed = timed(greedy_maximal_matching, range(num_vertices), edge_list)
+    print(f"  {'greedy (sequential)':<28} {elapsed:8.3f} s  size = {len(sequential)}")
+
+    streamed, elapsed = timed(greedy_maximal_matching_stream, num_vertices, edges)
+    print(f"  {'greedy (streamed chunks)':<28} {elapsed:8.3f} s  size = {len(streamed)}")
+
+    for workers in (1, 2, 4, 8):
+        matching, elapsed = timed(randomized_maximal_matching, num_vertices, edges, workers=workers)
+        assert is_maximal_matching(num_vertices, edges, matching)
+        print(f"  {f'randomized, {workers} worker(s)':<28} {elapsed:8.3f} s  size = {len(matching)}")
@@ -0,0 +1,106 @@
+from collections import deque
+
+from .edmonds_karp import ResidualGraph
+
+def _build_levels(residual, source, sink, level):
+    offsets = residual.offsets
+    heads = residual.heads
+    capacity = residual.capacity
+
+    for i in range(residual.n):
+        level[i] = -1
+    level[source] = 0
+    queue = deque([source])
+
+    while queue:
+        u = queue.popleft()
+        next_level = level[u] + 1
+        for e in range(offsets[u], offsets[u + 1]):
+            if capacity[e] > 0:
+                v = heads[e]
+                if level[v] < 0:
+                    level[v] = next_level
+                    queue.append(v)
+    return level[sink] >= 0
+
+def _blocking_flow(residual, source, sink, level, current_arc):
+    # Итеративный DFS по слоистой сети с указателями текущей дуги:
+    # каждая дуга просматривается не более одного раза за фазу
+    offsets = residual.offsets
+    heads = residual.heads
+    capacity = residual.capacity
+    rev = residual.rev
+
+    total = 0
+    path = []
+    u = source
+
+    while True:
+        if u == sink:
+            path_flow = min(capacity[e] for e in path)
+            for e in path:
+                capacity[e] -= path_flow
+                capacity[rev[e]] += path_flow
+            total += path_flow
+
+            # Откатываемся к началу первой насыщенной дуги
+            k = 0
+            while capacity[path[k]] > 0:
+                k += 1
+            del path[k:]
+            u = heads[path[-1]] if path else source
+            continue
+
+        end = offsets[u + 1]
+        e = current_arc[u]
+        next_level = level[u] + 1
+        while e < end and (capacity[e] <= 0 or level[heads[e]] != next_level):
+            e += 1
+        current_arc[u] = e
+
+        if e < end:
+            path.append(e)
+            u = heads[e]
+        else:
+            # Тупик: вершина больше не участвует в этой фазе
+            level[u] = -1
+            if u == source:
+                break
+            e = path.pop()
+            u = heads[rev[e]]
+            current_arc[u] += 1
+
+    return total
+
+def dinic_ids(residual, source, sink):
+    if source == sink:
+        return 0
+
+    level = [-1] * residual.n
+    max_flow = 0
+
+    while _build_levels(residual, source, sink, level):
+        current_arc = residual.offsets[:residual.n]
+        max_flow += _blocking_flow(residual, source, sink, level, current_arc)
+
+    return max_flow
+
+def dinic(capacity_graph, source, sink):
+    residual = ResidualGraph.from_capacity_graph(capacity_graph)
+    if source not in residual.index or sink not in residual.index:
+        return 0
+    return dinic_ids(residual, residual.index[source], residual.index[sink])
+
+# --- Пример использования ---
+if __name__ == "__main__":
+    graph_capacities = {
+        's': {'a': 10, 'b': 10},
+        'a': {'c': 4, 'd': 8},
+        'b': {'a': 2, 'd': 9},
+        'c': {'t': 10},
+        'd': {'c': 6, 't': 10},
+        't': {}
+    }
+
+    max_flow_value = dinic(graph_capacities, 's', 't')
+    print(f"Максимальный поток (Диниц) из 's' в 't': {max_flow_value}")
@@ -2,90 +2,296 @@ from collections import deque
 
 INF = float('inf')
 
-def bfs(graph, s, t, parent):
-    visited = {node: False for node in graph}
-    queue = deque()
-
-    queue.append(s)
-    visited[s] = True
-    parent[s] = -1
-
-    while queue:
-        u = queue.popleft()
-        if u in graph:
-            for v, capacity in graph[u].items():
-                if not visited.get(v, False) and capacity > 0: # Используем get для безопасности
-                    queue.append(v)
-                    visited[v] = True
-                    parent[v] = u
-                    if v == t:
-                        return True
-    return False
-
-def edmonds_karp(capacity_graph, source, sink):
-    residual_graph = {u: dict(neighbors) for u, neighbors in capacity_graph.items()}
-    nodes = set(residual_graph.keys())
-
-    # Сбор всех уникальных узлов и инициализация обратных ребер
-    nodes_to_process = list(capacity_graph.keys())
-    processed_nodes = set()
-    while nodes_to_process:
-        u = nodes_to_process.pop(0)
-        if u in processed_nodes:
-            continue
-        processed_nodes.add(u)
-        nodes.add(u)
-        if u in capacity_graph: # Убеждаемся, что узел есть в исходном графе
-            for v in list(capacity_graph[u].keys()): # Используем list для безопасной итерации
-                 nodes.add(v)
-                 if v not in residual_graph:
-                     residual_graph[v] = {}
-                 if u not in residual_graph.get(v, {}): # Безопасная проверка и добавление обратного ребра
-                     residual_graph[v][u] = 0
-                 if v not in processed_nodes and v not in nodes_to_process:
-                      nodes_to_process.append(v) # Добавляем соседа для обработки
-
-    parent = {node: -1 for node in nodes}
-    max_flow = 0
+class ResidualGraph:
+    """
+    Остаточная сеть в формате CSR над целочисленными номерами вершин.
+
+    Дуги вершины u занимают позиции offsets[u] .. offsets[u + 1] - 1 в массивах
+    heads и capacity, обратная к дуге e имеет номер rev[e]. Каждое входное ребро
+    u -> v даёт прямую дугу с его пропускной способностью и обратную дугу с нулевой.
+    """
+
+    def __init__(self, n, edges, labels=None):
+        self.n = n
+        self.labels = labels if labels is not None else list(range(n))
+        self.index = {label: i for i, label in enumerate(self.labels)}
+
+        # Подсчёт степеней и префиксные суммы -- один линейный проход
+        offsets = [0] * (n + 1)
+        for u, v, _ in edges:
+            offsets[u + 1] += 1
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        arc_count = offsets[n]
+        heads = [0] * arc_count
+        capacity = [0] * arc_count
+        rev = [0] * arc_count
+        edge_arcs = [0] * len(edges)
+        position = offsets[:n]
+
+        for k, (u, v, c) in enumerate(edges):
+            a = position[u]
+            position[u] += 1
+            b = position[v]
+            position[v] += 1
+            heads[a] = v
+            capacity[a] = c
+            rev[a] = b
+            heads[b] = u
+            rev[b] = a
+            edge_arcs[k] = a
+
+        self.offsets = offsets
+        self.heads = heads
+        self.capacity = capacity
+        self.rev = rev
+        self.edge_arcs = edge_arcs
+        self.initial_capacity = capacity[:]
+
+        # Буферы BFS выделяются один раз и переиспользуются между проходами:
+        # вершина посещена, если visited[v] совпадает с текущей меткой прохода
+        self.parent_arc = [-1] * n
+        self.visited = [0] * n
+        self._stamp = 0
+
+    @classmethod
+    def from_capacity_graph(cls, capacity_graph):
+        labels = []
+        index = {}
+        for u, neighbors in capacity_graph.items():
+            if u not in index:
+                index[u] = len(labels)
+                labels.append(u)
+            for v in neighbors:
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+
+        edges = [(index[u], index[v], c)
+                 for u, neighbors in capacity_graph.items()
+                 for v, c in neighbors.items()]
+        return cls(len(labels), edges, labels)
+
+    def bfs(self, s, t, threshold=0):
+        self._stamp += 1
+        stamp = self._stamp
+        visited = self.visited
+        parent_arc = self.parent_arc
+        offsets = self.offsets
+        heads = self.heads
+        capacity = self.capacity
+
+        visited[s] = stamp
+        parent_arc[s] = -1
+        queue = deque([s])
+
+        while queue:
+            u = queue.popleft()
+            for e in range(offsets[u], offsets[u + 1]):
+                if capacity[e] > threshold:
+                    v = heads[e]
+                    if visited[v] != stamp:
+                        visited[v] = stamp
+                        parent_arc[v] = e
+                        if v == t:
+                            return True
+                        queue.append(v)
+        return False
+
+    def reset(self):
+        self.capacity[:] = self.initial_capacity
+
+    def reachable(self, s):
+        # Вершины, достижимые из s по дугам с положительной остаточной
+        # способностью; после максимального потока это сторона истока в min-разрезе
+        self.bfs(s, -1)
+        stamp = self._stamp
+        return [v for v in range(self.n) if self.visited[v] == stamp]
+
+    def reaching(self, t):
+        # Вершины, из которых t достижим по остаточной сети (обратный BFS);
+        # годится и для предпотока, где прямой BFS из истока не даёт разреза
+        self._stamp += 1
+        stamp = self._stamp
+        visited = self.visited
+        offsets = self.offsets
+        heads = self.heads
+        capacity = self.capacity
+        rev = self.rev
+
+        visited[t] = stamp
+        queue = deque([t])
+        result = [t]
+        while queue:
+            v = queue.popleft()
+            for e in range(offsets[v], offsets[v + 1]):
+                u = heads[e]
+                if visited[u] != stamp and capacity[rev[e]] > 0:
+                    visited[u] = stamp
+                    queue.append(u)
+                    result.append(u)
+        return result
+
+    def augment(self, s, t):
+        # Проталкивает поток вдоль пути, найденного последним вызовом bfs
+        parent_arc = self.parent_arc
+        heads = self.heads
+        capacity = self.capacity
+        rev = self.rev
 
-    while bfs(residual_graph, source, sink, parent):
         path_flow = INF
-        s = sink
-        while s != source:
-            # Проверяем наличие parent[s] и ребра в residual_graph перед доступом
-            if parent[s] == -1: # Не должно случаться при успешном BFS, но для безопасности
-                 break
-            if parent[s] not in residual_graph or s not in residual_graph[parent[s]]:
-                 # Обработка возможной ошибки отсутствия ребра в остаточном графе
-                 # Это может указывать на проблему в логике BFS или обновлении графа
-                 print(f"Ошибка: Отсутствует ожидаемое ребро в остаточном графе: {parent[s]} -> {s}")
-                 # Можно выбрать стратегию: прервать или пропустить обновление
-                 path_flow = 0 # Установить поток в 0, чтобы не менять max_flow
-                 break
-            path_flow = min(path_flow, residual_graph[parent[s]][s])
-            s = parent[s]
-        
-        if path_flow == 0: # Если произошла ошибка на этапе поиска path_flow
-             break # Прерываем основной цикл
-
-        max_flow += path_flow
-
-        v = sink
-        while v != source:
-            u = parent[v]
-            if u == -1: # Должно быть обработано ранее, но для страховки
-                 break
-            # Проверяем наличие ребер перед обновлением
-            if u in residual_graph and v in residual_graph[u]:
-                 residual_graph[u][v] -= path_flow
-            # Убедимся что v есть в residual_graph перед доступом к residual_graph[v]
-            if v not in residual_graph:
-                residual_graph[v] = {}
-            # Увеличиваем пропускную способность обратного ребра
-            residual_graph[v][u] = residual_graph[v].get(u, 0) + path_flow
-
-            v = parent[v]
+        v = t
+        while v != s:
+            e = parent_arc[v]
+            if capacity[e] < path_flow:
+                path_flow = capacity[e]
+            v = heads[rev[e]]
+
+        v = t
+        while v != s:
+            e = parent_arc[v]
+            capacity[e] -= path_flow
+            capacity[rev[e]] += path_flow
+            v = heads[rev[e]]
+
+        return path_flow
+
+class MaxFlowResult:
+    """
+    Полный результат edmonds_karp(..., full_result=True).
 
+    Хранит итоговую остаточную сеть, поэтому потоки по рёбрам, минимальный
+    разрез и разложение на пути получаются из неё без повторного расчёта потока.
+    """
+
+    def __init__(self, residual, source, sink, value):
+        self.residual = residual
+        self.source = source
+        self.sink = sink
+        self.value = value
+        self._source_side = None
+
+    def _edges(self):
+        residual = self.residual
+        labels = residual.labels
+        heads = residual.heads
+        rev = residual.rev
+        for a in residual.edge_arcs:
+            yield labels[heads[rev[a]]], labels[heads[a]], a
+
+    def edge_flows(self):
+        flows = {}
+        capacity = self.residual.capacity
+        rev = self.residual.rev
+        for u, v, a in self._edges():
+            flows.setdefault(u, {})[v] = capacity[rev[a]]
+        return flows
+
+    @property
+    def source_side(self):
+        # Один дополнительный BFS по остаточной сети, результат кэшируется
+        if self._source_side is None:
+            labels = self.residual.labels
+            self._source_side = {labels[v] for v in self.residual.reachable(self.source)}
+        return self._source_side
+
+    def min_cut_edges(self):
+        side = self.source_side
+        return [(u, v) for u, v, _ in self._edges() if u in side and v not in side]
+
+    def saturated_edges(self):
+        capacity = self.residual.capacity
+        initial = self.residual.initial_capacity
+        return [(u, v) for u, v, a in self._edges() if initial[a] > 0 and capacity[a] == 0]
+
+    def paths(self):
+        """
+        Лениво раскладывает поток на пути из истока в сток.
+
+        Выдаёт пары (список вершин пути, величина потока); циклы потока,
+        встреченные по дороге, сокращаются и не выдаются.
+        """
+        residual = self.residual
+        offsets = residual.offsets
+        heads = residual.heads
+        rev = residual.rev
+        labels = residual.labels
+        source, sink = self.source, self.sink
+
+        flow_left = [0] * len(heads)
+        for a in residual.edge_arcs:
+            flow_left[a] = residual.capacity[rev[a]]
+        current_arc = offsets[:residual.n]
+
+        while source != sink:
+            nodes = [source]
+            arcs = []
+            position = {source: 0}
+            u = source
+
+            while u != sink:
+                end = offsets[u + 1]
+                e = current_arc[u]
+                while e < end and flow_left[e] <= 0:
+                    e += 1
+                current_arc[u] = e
+                if e == end:
+                    return
+
+                v = heads[e]
+                if v in position:
+                    # Цикл потока: сокращаем его и продолжаем с вершины v
+                    i = position[v]
+                    cycle = arcs[i:] + [e]
+                    amount = min(flow_left[c] for c in cycle)
+                    for c in cycle:
+                        flow_left[c] -= amount
+                    for w in nodes[i + 1:]:
+                        del position[w]
+                    del nodes[i + 1:]
+                    del arcs[i:]
+                    u = v
+                    continue
+
+                position[v] = len(nodes)
+                nodes.append(v)
+                arcs.append(e)
+                u = v
+
+            amount = min(flow_left[e] for e in arcs)
+            for e in arcs:
+                flow_left[e] -= amount
+            yield [labels[w] for w in nodes], amount
+
+def edmonds_karp_ids(residual, source, sink):
+    max_flow = 0
+    while residual.bfs(source, sink):
+        max_flow += residual.augment(source, sink)
+    return max_flow
+
+def edmonds_karp(capacity_graph, source, sink, full_result=False):
+    """
+    Максимальный поток алгоритмом Эдмондса-Карпа.
+
+    Возвращает величину потока, а при full_result=True -- MaxFlowResult.
+    Исток или сток, которых нет в графе, дают нулевой поток в обоих режимах:
+    в полном результате они считаются изолированными вершинами.
+    """
+    residual = ResidualGraph.from_capacity_graph(capacity_graph)
+    if source not in residual.index or sink not in residual.index:
+        if not full_result:
+            return 0
+        capacity_graph = dict(capacity_graph)
+        capacity_graph.setdefault(source, {})
+        capacity_graph.setdefault(sink, {})
+        residual = ResidualGraph.from_capacity_graph(capacity_graph)
+
+    s, t = residual.index[source], residual.index[sink]
+    max_flow = edmonds_karp_ids(residual, s, t)
+    if full_result:
+        return MaxFlowResult(residual, s, t, max_flow)
     return max_flow
 
 # --- Пример использования ---
@@ -103,4 +309,11 @@ if __name__ == "__main__":
     sink_node = 't'
 
     max_flow_value = edmonds_karp(graph_capacities, source_node, sink_node)
-    print(f"Максимальный поток из '{source_node}' в '{sink_node}': {max_flow_value}")
\ No newline at end of file
+    print(f"Максимальный поток из '{source_node}' в '{sink_node}': {max_flow_value}")
+
+    result = edmonds_karp(graph_capacities, source_node, sink_node, full_result=True)
+    print(f"Потоки по рёбрам: {result.edge_flows()}")
+    print(f"Сторона истока в минимальном разрезе: {sorted(result.source_side)}")
+    print(f"Рёбра минимального разреза: {result.min_cut_edges()}")
+    for path, amount in result.paths():
+        print(f"  {' -> '.join(path)}: {amount}")
@@ -0,0 +1,138 @@
+from .edmonds_karp import INF, ResidualGraph
+from .max_flow import ALGORITHMS
+
+class GomoryHuTree:
+    """
+    Дерево разрезов: минимальный разрез между u и v равен минимальному весу
+    ребра на пути между ними в дереве.
+
+    parent[i] < i для всех вершин, кроме корня 0, поэтому дерево уже подвешено.
+    Запросы отвечаются двоичными подъёмами за O(log n).
+    """
+
+    def __init__(self, labels, parent, weight):
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.parent = parent
+        self.weight = weight
+
+        n = len(labels)
+        self.depth = [0] * n
+        for v in range(1, n):
+            self.depth[v] = self.depth[parent[v]] + 1
+
+        self.log = max(1, (n - 1).bit_length())
+        up = [parent[:]]
+        up[0][0] = 0
+        path_min = [weight[:]]
+        path_min[0][0] = INF
+        for k in range(1, self.log):
+            prev_up, prev_min = up[k - 1], path_min[k - 1]
+            up.append([prev_up[prev_up[v]] for v in range(n)])
+            path_min.append([min(prev_min[v], prev_min[prev_up[v]]) for v in range(n)])
+        self.up = up
+        self.path_min = path_min
+
+    def edges(self):
+        return [(self.labels[v], self.labels[self.parent[v]], self.weight[v])
+                for v in range(1, len(self.labels))]
+
+    def min_cut(self, u, v):
+        if u not in self.index or v not in self.index:
+            raise ValueError(f"Unknown vertex in query ({u!r}, {v!r})")
+        a, b = self.index[u], self.index[v]
+        if a == b:
+            return INF
+
+        up, path_min, depth = self.up, self.path_min, self.depth
+        result = INF
+        if depth[a] < depth[b]:
+            a, b = b, a
+
+        diff = depth[a] - depth[b]
+        k = 0
+        while diff:
+            if diff & 1:
+                result = min(result, path_min[k][a])
+                a = up[k][a]
+            diff >>= 1
+            k += 1
+        if a == b:
+            return result
+
+        for k in range(self.log - 1, -1, -1):
+            if up[k][a] != up[k][b]:
+                result = min(result, path_min[k][a], path_min[k][b])
+                a, b = up[k][a], up[k][b]
+        return min(result, path_min[0][a], path_min[0][b])
+
+def gomory_hu_tree(graph, algorithm='edmonds_karp'):
+    """
+    Строит дерево Гомори-Ху алгоритмом Гасфилда: ровно n - 1 запусков
+    максимального потока на одной и той же остаточной сети.
+
+    graph -- неориентированный граф в виде словаря пропускных способностей;
+    симметричные записи graph[u][v] и graph[v][u] задают одно и то же ребро.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown max-flow algorithm: {algorithm!r}. "
+                         f"Expected one of {sorted(ALGORITHMS)}")
+    solver = ALGORITHMS[algorithm]
+
+    labels = []
+    index = {}
+    for u, neighbors in graph.items():
+        for w in (u, *neighbors):
+            if w not in index:
+                index[w] = len(labels)
+                labels.append(w)
+
+    undirected = {}
+    for u, neighbors in graph.items():
+        for v, c in neighbors.items():
+            if u == v:
+                continue
+            key = (index[u], index[v]) if index[u] < index[v] else (index[v], index[u])
+            if key in undirected and undirected[key] != c:
+                raise ValueError(f"Asymmetric capacities for undirected edge ({u!r}, {v!r})")
+            undirected[key] = c
+
+    # Неориентированное ребро -- пара встречных дуг с одинаковой способностью
+    edges = []
+    for (u, v), c in undirected.items():
+        edges.append((u, v, c))
+        edges.append((v, u, c))
+    residual = ResidualGraph(len(labels), edges, labels)
+
+    n = len(labels)
+    parent = [0] * n
+    weight = [0] * n
+    for s in range(1, n):
+        t = parent[s]
+        residual.reset()
+        weight[s] = solver(residual, s, t)
+        # Сторона стока -- вершины, ещё достигающие t; остальные отходят к s
+        sink_side = [False] * n
+        for v in residual.reaching(t):
+            sink_side[v] = True
+        for i in range(s + 1, n):
+            if not sink_side[i] and parent[i] == t:
+                parent[i] = s
+
+    return GomoryHuTree(labels, parent, weight)
+
+# --- Пример использования ---
+if __name__ == "__main__":
+    network = {
+        0: {1: 1, 2: 7},
+        1: {2: 1, 3: 3, 4: 2},
+        2: {4: 4},
+        3: {4: 1, 5: 6},
+        4: {5: 2},
+        5: {}
+    }
+
+    tree = gomory_hu_tree(network)
+    print("Рёбра дерева Гомори-Ху:", tree.edges())
+    for u, v in [(0, 5), (1, 4), (2, 3), (0, 2)]:
+        print(f"Минимальный разрез между {u} и {v}: {tree.min_cut(u, v)}")
@@ -1,7 +1,3 @@
-import random
-import numpy as np
-import warnings
-
 def greedy_maximal_matching(vertices, edges):
     matching = set()
     covered_vertices = set()
@@ -15,35 +11,390 @@ def greedy_maximal_matching(vertices, edges):
     matching_list = [tuple(sorted(list(edge))) for edge in matching]
     return matching_list
 
-num_vertices_1 = 5
-vertices_1 = list(range(num_vertices_1))
-edges_1 = [(0, 1), (1, 2), (2, 3), (3, 4)]
-greedy_m1 = greedy_maximal_matching(vertices_1, edges_1)
-print(f"Graph 1 (P5): Edges={edges_1}")
-print(f"  Greedy Maximal Matching: {greedy_m1}")
-print(f"  Size: {len(greedy_m1)}")
-
-num_vertices_2 = 5
-vertices_2 = list(range(num_vertices_2))
-edges_2_ordered = [(0, 1), (2, 3), (4, 0), (1, 2), (3, 4), (0, 2)]
-greedy_m2a = greedy_maximal_matching(vertices_2, edges_2_ordered)
-print(f"\nGraph 2 (C5 + (0,2)): Edges={edges_2_ordered}")
-print(f"  Greedy Maximal Matching: {greedy_m2a}")
-print(f"  Size: {len(greedy_m2a)}") 
-
-edges_2_ordered_b = [(0, 2), (3, 4), (0, 1), (1, 2), (2, 3), (4, 0) ] 
-greedy_m2b = greedy_maximal_matching(vertices_2, edges_2_ordered_b)
-print(f"\nGraph 2 (C5 + (0,2)): Edges={edges_2_ordered_b}")
-print(f"  Greedy Maximal Matching: {greedy_m2b}")
-print(f"  Size: {len(greedy_m2b)}") 
-
-num_vertices_3 = 6
-vertices_3 = list(range(num_vertices_3)) 
-edges_3 = []
-for i in range(3):
-    for j in range(3, 6):
-        edges_3.append((i, j))
-greedy_m3 = greedy_maximal_matching(vertices_3, edges_3)
-print(f"\nGraph 3 (K3,3): Edges={edges_3}")
-print(f"  Greedy Maximal Matching: {greedy_m3}")
-print(f"  Size: {len(greedy_m3)}")
+def iter_edge_chunks(edges, chunk_size=1 << 20):
+    """
+    Yields the edge stream as int64 arrays of shape (k, 2), k <= chunk_size.
+
+    edges may be an (m, 2) array, a path to a .npy file of shape (m, 2)
+    (memory-mapped), a path to a text file with one "u v" pair per line,
+    or any iterable of (u, v) pairs.
+    """
+    import os
+    from itertools import islice
+
+    import numpy as np
+
+    if isinstance(edges, (str, os.PathLike)) and os.fspath(edges).endswith('.npy'):
+        edges = np.load(edges, mmap_mode='r')
+
+    if isinstance(edges, np.ndarray):
+        edges = edges.reshape(-1, 2)
+        for start in range(0, len(edges), chunk_size):
+            yield np.asarray(edges[start:start + chunk_size], dtype=np.int64)
+        return
+
+    if isinstance(edges, (str, os.PathLike)):
+
+        with open(edges) as f:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    return
+                lines = [line for line in lines if line.strip() and not line.startswith('#')]
+                if lines:
+                    yield np.loadtxt(lines, dtype=np.int64, ndmin=2, usecols=(0, 1))
+
+    iterator = iter(edges)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield np.array(chunk, dtype=np.int64).reshape(-1, 2)
+
+def _match_chunk(chunk, covered, first, result, size):
+    import numpy as np
+
+    u, v = chunk[:, 0], chunk[:, 1]
+    candidates = (u != v) & ~covered[u] & ~covered[v]
+    u, v = u[candidates], v[candidates]
+
+    # Rounds of vectorized acceptance: an edge is taken when it is the earliest
+    # remaining candidate at both of its endpoints, which is exactly what the
+    # sequential greedy scan would do with it. Long dependency chains make the
+    # rounds unproductive, so the tail falls back to a plain scan.
+    while len(u):
+        # first is an all-max scratch buffer; only the touched entries are reset
+        position = np.arange(len(u))
+        np.minimum.at(first, u, position)
+        np.minimum.at(first, v, position)
+        accepted = (first[u] == position) & (first[v] == position)
+        first[u] = first[v] = np.iinfo(np.int64).max
+
+        count = int(accepted.sum())
+        result[size:size + count, 0] = u[accepted]
+        result[size:size + count, 1] = v[accepted]
+        size += count
+        covered[u[accepted]] = True
+        covered[v[accepted]] = True
+
+        remaining = ~covered[u] & ~covered[v]
+        u, v = u[remaining], v[remaining]
+        if count * 8 < len(u):
+            break
+
+    for a, b in zip(u.tolist(), v.tolist()):
+        if not covered[a] and not covered[b]:
+            covered[a] = covered[b] = True
+            result[size] = (a, b)
+            size += 1
+
+    return size
+
+def greedy_maximal_matching_stream(num_vertices, edges, chunk_size=1 << 20):
+    """
+    Semi-streaming greedy maximal matching over vertices 0 .. num_vertices - 1.
+
+    Edges are consumed chunk by chunk (see iter_edge_chunks), so memory is O(n):
+    a bool array of covered vertices plus a preallocated (n // 2, 2) result array.
+    The matching is the same one greedy_maximal_matching finds for the same edge
+    order. Returns an int64 array of shape (k, 2) with u < v in every row.
+    """
+    import numpy as np
+
+    covered = np.zeros(num_vertices, dtype=bool)
+    first = np.full(num_vertices, np.iinfo(np.int64).max, dtype=np.int64)
+    result = np.empty((num_vertices // 2, 2), dtype=np.int64)
+    size = 0
+
+    for chunk in iter_edge_chunks(edges, chunk_size):
+        if chunk.size and (chunk.min() < 0 or chunk.max() >= num_vertices):
+            raise ValueError(f"Edge endpoint out of range for num_vertices={num_vertices}")
+        size = _match_chunk(chunk, covered, first, result, size)
+
+    matching = result[:size]
+    matching.sort(axis=1)
+    return matching
+
+_SPLITMIX_GAMMA = 0x9E3779B97F4A7C15
+
+# Shared-memory views attached once per pool worker by _attach_shared
+_shared = {}
+
+def _edge_keys(tags, round_seed, id_bits):
+    # Column 2 of the working edge array is a unique tag per edge. With a round
+    # seed the key is a pseudo-random priority (splitmix64 of the tag) whose low
+    # bits carry the tag itself, so keys stay unique; without one the tag is the key.
+    import numpy as np
+
+    ids = tags.astype(np.uint64)
+    if round_seed is None:
+        return ids
+    x = ids + np.uint64((round_seed * _SPLITMIX_GAMMA) % (1 << 64))
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    shift = np.uint64(id_bits)
+    return ((x >> shift) << shift) | ids
+
+def _propose(edges, covered, scratch, start, end, round_seed, id_bits):
+    # Compacts the partition to its live edges in place, then reports the
+    # minimum key per endpoint among them. scratch is an all-max uint64 array
+    # of size n owned by the caller; only the touched entries are reset.
+    import numpy as np
+
+    u, v = edges[start:end, 0], edges[start:end, 1]
+    live = (u != v) & ~covered[u] & ~covered[v]
+    count = int(live.sum())
+    edges[start:start + count] = edges[start:end][live]
+    if not count:
+        return count, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint64)
+
+    part = edges[start:start + count]
+    keys = _edge_keys(part[:, 2], round_seed, id_bits)
+    vertices = np.concatenate([part[:, 0], part[:, 1]])
+    keys = np.concatenate([keys, keys])
+    np.minimum.at(scratch, vertices, keys)
+    local_min = scratch[vertices] == keys
+    scratch[vertices] = np.iinfo(np.uint64).max
+    return count, vertices[local_min], keys[local_min]
+
+def _select(edges, best, start, end, round_seed, id_bits):
+    # Edges that hold the global minimum key at both endpoints form a matching
+    part = edges[start:end]
+    u, v = part[:, 0], part[:, 1]
+    keys = _edge_keys(part[:, 2], round_seed, id_bits)
+    chosen = (best[u] == keys) & (best[v] == keys)
+    return u[chosen], v[chosen]
+
+def _attach_shared(names):
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    for key, (name, shape, dtype) in names.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+def _propose_shared(start, end, round_seed, id_bits):
+    import numpy as np
+
+    covered = _shared['covered'][1]
+    if 'scratch' not in _shared:
+        _shared['scratch'] = (None, np.full(len(covered), np.iinfo(np.uint64).max, dtype=np.uint64))
+    return _propose(_shared['edges'][1], covered, _shared['scratch'][1], start, end, round_seed, id_bits)
+
+def _select_shared(start, end, round_seed, id_bits):
+    return _select(_shared['edges'][1], _shared['best'][1], start, end, round_seed, id_bits)
+
+def _local_minimum_matching(num_vertices, edges, workers, next_seed, partitions_per_worker):
+    # edges: private (m, 3) int64 array of (u, v, tag), compacted in place.
+    # next_seed() gives the round seed, or None for fixed keys equal to the tags.
+    import numpy as np
+
+    if edges.size and (edges[:, :2].min() < 0 or edges[:, :2].max() >= num_vertices):
+        raise ValueError(f"Edge endpoint out of range for num_vertices={num_vertices}")
+
+    m = len(edges)
+    if not m:
+        return np.empty((0, 2), dtype=np.int64)
+    id_bits = max(1, m.bit_length())
+    no_key = np.iinfo(np.uint64).max
+    step = max(1, -(-m // (workers * partitions_per_worker)))
+    ranges = [(start, min(start + step, m)) for start in range(0, m, step)]
+    matched = []
+
+    # The pool and the shared segments are created inside the try, so the finally
+    # block releases whatever was set up even when setup itself fails
+    pool = None
+    blocks = {}
+    arrays = {}
+    covered = best = None
+    try:
+        if workers <= 1:
+            covered = np.zeros(num_vertices, dtype=bool)
+            best = np.full(num_vertices, no_key, dtype=np.uint64)
+            scratch = best.copy()
+
+            def propose(round_seed):
+                return [_propose(edges, covered, scratch, start, end, round_seed, id_bits) for start, end in ranges]
+
+            def select(round_seed):
+                return [_select(edges, best, start, end, round_seed, id_bits) for start, end in ranges]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import shared_memory
+
+            for key, shape, dtype in (('edges', edges.shape, np.int64),
+                                      ('covered', (num_vertices,), np.bool_),
+                                      ('best', (num_vertices,), np.uint64)):
+                nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+                blocks[key] = shared_memory.SharedMemory(create=True, size=nbytes)
+                arrays[key] = np.ndarray(shape, dtype=dtype, buffer=blocks[key].buf)
+            arrays['edges'][:] = edges
+            arrays['covered'][:] = False
+            arrays['best'][:] = no_key
+            covered, best = arrays['covered'], arrays['best']
+
+            names = {key: (block.name, arrays[key].shape, arrays[key].dtype) for key, block in blocks.items()}
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared, initargs=(names,))
+
+            def run_on_pool(task, round_seed):
+                starts, ends = zip(*ranges)
+                k = len(ranges)
+                return list(pool.map(task, starts, ends, [round_seed] * k, [id_bits] * k))
+
+            def propose(round_seed):
+                return run_on_pool(_propose_shared, round_seed)
+
+            def select(round_seed):
+                return run_on_pool(_select_shared, round_seed)
+
+        while True:
+            round_seed = next_seed()
+            proposals = propose(round_seed)
+            ranges = [(start, start + count) for (start, _), (count, _, _) in zip(ranges, proposals) if count]
+            if not ranges:
+                break
+            vertices = np.concatenate([p[1] for p in proposals])
+            keys = np.concatenate([p[2] for p in proposals])
+
+            # Conflict resolution across partitions: global minimum key per vertex
+            np.minimum.at(best, vertices, keys)
+            for u, v in select(round_seed):
+                covered[u] = True
+                covered[v] = True
+                matched.append(np.stack([u, v], axis=1))
+            best[vertices] = no_key
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        # Views into the segments must be gone before they can be closed
+        covered = best = None
+        arrays.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    matching = np.concatenate(matched) if matched else np.empty((0, 2), dtype=np.int64)
+    matching.sort(axis=1)
+    return matching
+
+def randomized_maximal_matching(num_vertices, edges, workers=1, seed=0, partitions_per_worker=4):
+    """
+    Round-based randomized maximal matching (local-minimum edges, Israeli-Itai style).
+
+    Each round gives every live edge a fresh random key; an edge joins the matching
+    when its key is the smallest among live edges at both endpoints. Matched vertices
+    are covered, edges touching them die, and rounds repeat until no live edge is
+    left, so the result is maximal after an expected O(log m) rounds.
+
+    With workers > 1 the edge array, the covered flags and the per-vertex minima
+    live in shared memory, and both phases of a round run over edge partitions on a
+    process pool. Returns an int64 array of shape (k, 2) with u < v in every row.
+    """
+    import numpy as np
+
+    pairs = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    working = np.empty((len(pairs), 3), dtype=np.int64)
+    working[:, :2] = pairs
+    working[:, 2] = np.arange(len(pairs))
+
+    rng = np.random.default_rng(seed)
+    return _local_minimum_matching(num_vertices, working, workers,
+                                   lambda: int(rng.integers(1 << 62)), partitions_per_worker)
+
+def _weight_ranks(u, v, w):
+    import numpy as np
+
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    w = np.asarray(w)
+    if not (u.shape == v.shape == w.shape) or u.ndim != 1:
+        raise ValueError("u, v and w must be one-dimensional arrays of equal length")
+    # Heaviest first; the stable sort breaks ties by input position
+    return u, v, np.argsort(-w, kind='stable')
+
+def greedy_weighted_matching(num_vertices, u, v, w, chunk_size=1 << 20):
+    """
+    Greedy 1/2-approximate maximum weight matching.
+
+    Edges (u[i], v[i]) with weight w[i] are sorted heaviest first with argsort and
+    taken whenever both endpoints are still free; the covering pass runs over int
+    arrays with the vectorized rounds of greedy_maximal_matching_stream.
+    O(m log m) time, no dense matrix. Returns an int64 array of shape (k, 2).
+    """
+    import numpy as np
+
+    u, v, order = _weight_ranks(u, v, w)
+    return greedy_maximal_matching_stream(num_vertices, np.stack([u[order], v[order]], axis=1), chunk_size)
+
+def locally_dominant_matching(num_vertices, u, v, w, workers=1, partitions_per_worker=4):
+    """
+    Parallel 1/2-approximate maximum weight matching (locally dominant edges).
+
+    An edge joins the matching when it is the heaviest live edge at both of its
+    endpoints; rounds repeat until no live edge is left. With ties broken by input
+    position this yields the same matching as greedy_weighted_matching, but each
+    round is data-parallel and runs over edge partitions on a process pool when
+    workers > 1. Returns an int64 array of shape (k, 2) with u < v in every row.
+    """
+    import numpy as np
+
+    u, v, order = _weight_ranks(u, v, w)
+    working = np.empty((len(u), 3), dtype=np.int64)
+    working[:, 0] = u
+    working[:, 1] = v
+    working[order, 2] = np.arange(len(u))
+    return _local_minimum_matching(num_vertices, working, workers, lambda: None, partitions_per_worker)
+
+if __name__ == "__main__":
+    import numpy as np
+
+    num_vertices_1 = 5
+    vertices_1 = list(range(num_vertices_1))
+    edges_1 = [(0, 1), (1, 2), (2, 3), (3, 4)]
+    greedy_m1 = greedy_maximal_matching(vertices_1, edges_1)
+    print(f"Graph 1 (P5): Edges={edges_1}")
+    print(f"  Greedy Maximal Matching: {greedy_m1}")
+    print(f"  Size: {len(greedy_m1)}")
+
+    num_vertices_2 = 5
+    vertices_2 = list(range(num_vertices_2))
+    edges_2_ordered = [(0, 1), (2, 3), (4, 0), (1, 2), (3, 4), (0, 2)]
+    greedy_m2a = greedy_maximal_matching(vertices_2, edges_2_ordered)
+    print(f"\nGraph 2 (C5 + (0,2)): Edges={edges_2_ordered}")
+    print(f"  Greedy Maximal Matching: {greedy_m2a}")
+    print(f"  Size: {len(greedy_m2a)}") 
+
+    edges_2_ordered_b = [(0, 2), (3, 4), (0, 1), (1, 2), (2, 3), (4, 0) ] 
+    greedy_m2b = greedy_maximal_matching(vertices_2, edges_2_ordered_b)
+    print(f"\nGraph 2 (C5 + (0,2)): Edges={edges_2_ordered_b}")
+    print(f"  Greedy Maximal Matching: {greedy_m2b}")
+    print(f"  Size: {len(greedy_m2b)}") 
+
+    num_vertices_3 = 6
+    vertices_3 = list(range(num_vertices_3)) 
+    edges_3 = []
+    for i in range(3):
+        for j in range(3, 6):
+            edges_3.append((i, j))
+    greedy_m3 = greedy_maximal_matching(vertices_3, edges_3)
+    print(f"\nGraph 3 (K3,3): Edges={edges_3}")
+    print(f"  Greedy Maximal Matching: {greedy_m3}")
+    print(f"  Size: {len(greedy_m3)}")
+
+    streamed_m3 = greedy_maximal_matching_stream(num_vertices_3, iter(edges_3), chunk_size=4)
+    print(f"\nGraph 3 (K3,3), streamed in chunks of 4: {streamed_m3.tolist()}")
+
+    randomized_m3 = randomized_maximal_matching(num_vertices_3, edges_3, seed=1)
+    print(f"Graph 3 (K3,3), randomized rounds: {randomized_m3.tolist()}")
+
+    weighted_u = np.array([0, 1, 2, 3, 0])
+    weighted_v = np.array([1, 2, 3, 4, 4])
+    weighted_w = np.array([3.0, 5.0, 4.0, 1.0, 2.0])
+    weighted_m = greedy_weighted_matching(5, weighted_u, weighted_v, weighted_w)
+    print(f"\nWeighted C5: greedy 1/2-approximation: {weighted_m.tolist()}")
+    dominant_m = locally_dominant_matching(5, weighted_u, weighted_v, weighted_w)
+    print(f"Weighted C5: locally dominant edges: {dominant_m.tolist()}")
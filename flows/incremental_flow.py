@@ -0,0 +1,197 @@
+from collections import deque
+
+from .edmonds_karp import INF, ResidualGraph
+
+class MaxFlowSession:
+    """
+    Максимальный поток, поддерживаемый между изменениями пропускных способностей.
+
+    Остаточная сеть строится один раз через ResidualGraph, затем CSR-массивы
+    переводятся в списки смежности, чтобы рёбра можно было добавлять и удалять.
+    После каждого изменения reoptimize() дополняет поток начиная с текущего,
+    а не пересчитывает его с нуля.
+    """
+
+    def __init__(self, capacity_graph, source, sink):
+        residual = ResidualGraph.from_capacity_graph(capacity_graph)
+        self.labels = residual.labels
+        self.index = residual.index
+        self.heads = residual.heads
+        self.capacity = residual.capacity
+        self.rev = residual.rev
+        self.adj = [list(range(residual.offsets[u], residual.offsets[u + 1]))
+                    for u in range(residual.n)]
+        self.parent_arc = residual.parent_arc
+        self.visited = residual.visited
+        self._stamp = 0
+
+        self.edge_arc = {}
+        for (u, v), a in zip(((u, v) for u, neighbors in capacity_graph.items()
+                              for v in neighbors), residual.edge_arcs):
+            self.edge_arc[(u, v)] = a
+
+        self.source = self._node_id(source)
+        self.sink = self._node_id(sink)
+        self.flow_value = 0
+        self.reoptimize()
+
+    def _node_id(self, label):
+        if label not in self.index:
+            self.index[label] = len(self.labels)
+            self.labels.append(label)
+            self.adj.append([])
+            self.parent_arc.append(-1)
+            self.visited.append(0)
+        return self.index[label]
+
+    def _arc(self, u, v):
+        if (u, v) not in self.edge_arc:
+            raise ValueError(f"Edge ({u!r}, {v!r}) is not in the network")
+        return self.edge_arc[(u, v)]
+
+    def _bfs(self, start, target):
+        self._stamp += 1
+        stamp = self._stamp
+        visited = self.visited
+        parent_arc = self.parent_arc
+        heads = self.heads
+        capacity = self.capacity
+        adj = self.adj
+
+        visited[start] = stamp
+        parent_arc[start] = -1
+        queue = deque([start])
+
+        while queue:
+            u = queue.popleft()
+            for e in adj[u]:
+                if capacity[e] > 0:
+                    v = heads[e]
+                    if visited[v] != stamp:
+                        visited[v] = stamp
+                        parent_arc[v] = e
+                        if v == target:
+                            return True
+                        queue.append(v)
+        return False
+
+    def _augment(self, start, target, limit=INF):
+        parent_arc = self.parent_arc
+        heads = self.heads
+        capacity = self.capacity
+        rev = self.rev
+
+        path_flow = limit
+        v = target
+        while v != start:
+            e = parent_arc[v]
+            if capacity[e] < path_flow:
+                path_flow = capacity[e]
+            v = heads[rev[e]]
+
+        v = target
+        while v != start:
+            e = parent_arc[v]
+            capacity[e] -= path_flow
+            capacity[rev[e]] += path_flow
+            v = heads[rev[e]]
+
+        return path_flow
+
+    def _route(self, start, target, amount):
+        # Проталкивает до amount единиц из start в target по остаточной сети
+        routed = 0
+        while routed < amount and start != target and self._bfs(start, target):
+            routed += self._augment(start, target, amount - routed)
+        return routed
+
+    def flow(self, u, v):
+        a = self._arc(u, v)
+        return self.capacity[self.rev[a]]
+
+    def edge_capacity(self, u, v):
+        a = self._arc(u, v)
+        return self.capacity[a] + self.capacity[self.rev[a]]
+
+    def set_capacity(self, u, v, new_capacity):
+        if new_capacity < 0:
+            raise ValueError("Capacity must be non-negative")
+        a = self._arc(u, v)
+        b = self.rev[a]
+        current_flow = self.capacity[b]
+
+        if new_capacity >= current_flow:
+            self.capacity[a] = new_capacity - current_flow
+            return
+
+        # Поток по ребру превышает новую пропускную способность: избыток
+        # сначала перенаправляется в обход ребра, а остаток возвращается
+        # к истоку из u и забирается у стока в v
+        excess = current_flow - new_capacity
+        self.capacity[a] = 0
+        self.capacity[b] = new_capacity
+
+        ui, vi = self.index[u], self.index[v]
+        excess -= self._route(ui, vi, excess)
+        if excess > 0:
+            returned = self._route(ui, self.source, excess) if ui != self.source else excess
+            withdrawn = self._route(self.sink, vi, excess) if vi != self.sink else excess
+            if returned != excess or withdrawn != excess:
+                raise RuntimeError("Residual network is inconsistent with the current flow")
+            self.flow_value -= excess
+
+    def change_capacity(self, u, v, delta):
+        self.set_capacity(u, v, self.edge_capacity(u, v) + delta)
+
+    def add_edge(self, u, v, capacity):
+        if (u, v) in self.edge_arc:
+            raise ValueError(f"Edge ({u!r}, {v!r}) is already in the network")
+        if capacity < 0:
+            raise ValueError("Capacity must be non-negative")
+        ui, vi = self._node_id(u), self._node_id(v)
+
+        a = len(self.heads)
+        b = a + 1
+        self.heads.extend((vi, ui))
+        self.capacity.extend((capacity, 0))
+        self.rev.extend((b, a))
+        self.adj[ui].append(a)
+        self.adj[vi].append(b)
+        self.edge_arc[(u, v)] = a
+
+    def remove_edge(self, u, v):
+        self.set_capacity(u, v, 0)
+        a = self.edge_arc.pop((u, v))
+        b = self.rev[a]
+        self.adj[self.index[u]].remove(a)
+        self.adj[self.index[v]].remove(b)
+
+    def reoptimize(self):
+        source, sink = self.source, self.sink
+        if source != sink:
+            while self._bfs(source, sink):
+                self.flow_value += self._augment(source, sink)
+        return self.flow_value
+
+# --- Пример использования ---
+if __name__ == "__main__":
+    graph_capacities = {
+        's': {'a': 10, 'b': 10},
+        'a': {'c': 4, 'd': 8},
+        'b': {'a': 2, 'd': 9},
+        'c': {'t': 10},
+        'd': {'c': 6, 't': 10},
+        't': {}
+    }
+
+    session = MaxFlowSession(graph_capacities, 's', 't')
+    print(f"Начальный поток: {session.flow_value}")
+
+    session.set_capacity('d', 't', 4)
+    print(f"После уменьшения d->t до 4: {session.reoptimize()}")
+
+    session.add_edge('a', 't', 5)
+    print(f"После добавления a->t (5): {session.reoptimize()}")
+
+    session.remove_edge('s', 'b')
+    print(f"После удаления s->b: {session.reoptimize()}")
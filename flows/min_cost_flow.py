@@ -0,0 +1,201 @@
+import heapq
+from collections import deque
+
+from .edmonds_karp import INF, ResidualGraph
+
+class CostResidualGraph(ResidualGraph):
+    """
+    ResidualGraph со стоимостями дуг: прямая дуга ребра (u, v, c, w) стоит w,
+    обратная -w. Рёбра задаются четвёрками (u, v, capacity, cost).
+    """
+
+    def __init__(self, n, edges, labels=None):
+        super().__init__(n, [(u, v, c) for u, v, c, _ in edges], labels)
+        cost = [0] * len(self.heads)
+        for (_, _, _, w), a in zip(edges, self.edge_arcs):
+            cost[a] = w
+            cost[self.rev[a]] = -w
+        self.cost = cost
+
+def _initial_potentials(residual, source):
+    # Беллман-Форд с очередью нужен только при отрицательных стоимостях
+    n = residual.n
+    offsets = residual.offsets
+    heads = residual.heads
+    capacity = residual.capacity
+    cost = residual.cost
+
+    if all(cost[e] >= 0 for e in range(len(heads)) if capacity[e] > 0):
+        return [0] * n
+
+    potential = [INF] * n
+    potential[source] = 0
+    in_queue = [False] * n
+    queue = deque([source])
+    in_queue[source] = True
+    relaxations = 0
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        for e in range(offsets[u], offsets[u + 1]):
+            if capacity[e] > 0:
+                v = heads[e]
+                candidate = potential[u] + cost[e]
+                if candidate < potential[v]:
+                    potential[v] = candidate
+                    relaxations += 1
+                    if relaxations > n * len(heads):
+                        raise ValueError("Negative-cost cycle in the residual network")
+                    if not in_queue[v]:
+                        in_queue[v] = True
+                        queue.append(v)
+
+    return [p if p < INF else 0 for p in potential]
+
+def min_cost_flow_ids(residual, source, sink, flow_limit=INF):
+    """
+    Последовательные кратчайшие пути с потенциалами Джонсона.
+
+    Каждая итерация -- один Дейкстра на двоичной куче по приведённым
+    стоимостям cost[e] + potential[u] - potential[v] >= 0.
+    Возвращает (величина потока, суммарная стоимость).
+    """
+    if source == sink:
+        return 0, 0
+
+    n = residual.n
+    offsets = residual.offsets
+    heads = residual.heads
+    capacity = residual.capacity
+    cost = residual.cost
+    rev = residual.rev
+    parent_arc = residual.parent_arc
+
+    potential = _initial_potentials(residual, source)
+    dist = [INF] * n
+    flow = 0
+    total_cost = 0
+
+    while flow < flow_limit:
+        for i in range(n):
+            dist[i] = INF
+        dist[source] = 0
+        parent_arc[source] = -1
+        heap = [(0, source)]
+
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            pu = potential[u]
+            for e in range(offsets[u], offsets[u + 1]):
+                if capacity[e] > 0:
+                    v = heads[e]
+                    nd = d + cost[e] + pu - potential[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        parent_arc[v] = e
+                        heapq.heappush(heap, (nd, v))
+
+        if dist[sink] == INF:
+            break
+        for i in range(n):
+            if dist[i] < INF:
+                potential[i] += dist[i]
+
+        path_flow = flow_limit - flow
+        v = sink
+        while v != source:
+            e = parent_arc[v]
+            if capacity[e] < path_flow:
+                path_flow = capacity[e]
+            v = heads[rev[e]]
+
+        v = sink
+        while v != source:
+            e = parent_arc[v]
+            capacity[e] -= path_flow
+            capacity[rev[e]] += path_flow
+            total_cost += path_flow * cost[e]
+            v = heads[rev[e]]
+
+        flow += path_flow
+
+    return flow, total_cost
+
+def min_cost_flow(graph, source, sink, flow_limit=INF):
+    """
+    graph -- словарь вида {u: {v: (capacity, cost)}}.
+    Возвращает (величина потока, суммарная стоимость) для потока минимальной
+    стоимости величиной min(flow_limit, максимальный поток).
+    """
+    labels = []
+    index = {}
+    for u, neighbors in graph.items():
+        for w in (u, *neighbors):
+            if w not in index:
+                index[w] = len(labels)
+                labels.append(w)
+    if source not in index or sink not in index:
+        return 0, 0
+
+    edges = [(index[u], index[v], c, w)
+             for u, neighbors in graph.items()
+             for v, (c, w) in neighbors.items()]
+    residual = CostResidualGraph(len(labels), edges, labels)
+    return min_cost_flow_ids(residual, index[source], index[sink], flow_limit)
+
+def min_cost_assignment(triples, n_rows=None, n_cols=None):
+    """
+    Разреженное назначение минимальной стоимости через min-cost flow.
+
+    triples -- итерируемое тройки (row, col, cost) допустимых пар.
+    Память пропорциональна числу троек: плотная матрица не строится.
+    Назначается максимально возможное число строк, среди таких назначений
+    выбирается самое дешёвое.
+
+    Возвращает (row_ind, col_ind): row_ind[i] -- столбец строки i,
+    col_ind[j] -- строка столбца j, -1 для неназначенных.
+    """
+    triples = list(triples)
+    if n_rows is None:
+        n_rows = max((r for r, _, _ in triples), default=-1) + 1
+    if n_cols is None:
+        n_cols = max((c for _, c, _ in triples), default=-1) + 1
+
+    # Вершины: 0 -- исток, 1..n_rows -- строки, далее столбцы, последняя -- сток
+    source = 0
+    sink = n_rows + n_cols + 1
+    edges = [(source, 1 + r, 1, 0) for r in range(n_rows)]
+    edges.extend((1 + r, 1 + n_rows + c, 1, w) for r, c, w in triples)
+    edges.extend((1 + n_rows + c, sink, 1, 0) for c in range(n_cols))
+
+    residual = CostResidualGraph(sink + 1, edges)
+    min_cost_flow_ids(residual, source, sink)
+
+    row_ind = [-1] * n_rows
+    col_ind = [-1] * n_cols
+    capacity = residual.capacity
+    for k in range(len(triples)):
+        a = residual.edge_arcs[n_rows + k]
+        if capacity[a] == 0:
+            r, c, _ = triples[k]
+            row_ind[r] = c
+            col_ind[c] = r
+
+    return row_ind, col_ind
+
+# --- Пример использования ---
+if __name__ == "__main__":
+    graph = {
+        's': {'a': (4, 2), 'b': (2, 2)},
+        'a': {'b': (2, 1), 't': (3, 4)},
+        'b': {'t': (5, 1)},
+        't': {}
+    }
+    value, cost = min_cost_flow(graph, 's', 't')
+    print(f"Поток минимальной стоимости: величина = {value}, стоимость = {cost}")
+
+    triples = [(0, 0, 7), (0, 1, 5), (1, 1, 4), (1, 2, 3), (2, 2, 5), (2, 3, 6)]
+    row_ind, col_ind = min_cost_assignment(triples)
+    print(f"Назначение (строка -> столбец): {row_ind}")
@@ -0,0 +1,200 @@
+from collections import deque
+
+from .edmonds_karp import ResidualGraph
+
+class _HighestLabelPushRelabel:
+    """
+    Push-relabel с выбором активной вершины наибольшей высоты.
+
+    Используются эвристика разрыва (gap) и периодическая глобальная переразметка
+    обратным BFS от стока. Считается только первая фаза -- максимальный предпоток,
+    его избыток в стоке равен величине максимального потока.
+    """
+
+    def __init__(self, residual, source, sink):
+        self.residual = residual
+        self.source = source
+        self.sink = sink
+
+        n = residual.n
+        self.height = [0] * n
+        self.excess = [0] * n
+        self.current_arc = residual.offsets[:n]
+        self.count = [0] * (2 * n + 1)
+        self.buckets = [[] for _ in range(n)]
+        self.highest = -1
+
+    def _global_relabel(self):
+        residual = self.residual
+        offsets = residual.offsets
+        heads = residual.heads
+        capacity = residual.capacity
+        rev = residual.rev
+        n = residual.n
+        height = self.height
+        count = self.count
+
+        for i in range(n):
+            height[i] = n
+        for h in range(len(count)):
+            count[h] = 0
+        for bucket in self.buckets:
+            bucket.clear()
+
+        height[self.sink] = 0
+        queue = deque([self.sink])
+        while queue:
+            v = queue.popleft()
+            next_height = height[v] + 1
+            for e in range(offsets[v], offsets[v + 1]):
+                u = heads[e]
+                if height[u] == n and u != self.source and capacity[rev[e]] > 0:
+                    height[u] = next_height
+                    queue.append(u)
+        height[self.source] = n
+
+        self.highest = -1
+        for u in range(n):
+            self.current_arc[u] = offsets[u]
+            if height[u] < n:
+                count[height[u]] += 1
+                if self.excess[u] > 0 and u != self.sink:
+                    self.buckets[height[u]].append(u)
+                    if height[u] > self.highest:
+                        self.highest = height[u]
+
+    def _gap(self, gap_height):
+        # Вершины выше разрыва больше не могут достичь стока
+        n = self.residual.n
+        height = self.height
+        count = self.count
+        for v in range(n):
+            if gap_height < height[v] < n:
+                count[height[v]] -= 1
+                height[v] = n
+
+    def _relabel(self, u):
+        residual = self.residual
+        heads = residual.heads
+        capacity = residual.capacity
+        height = self.height
+        n = residual.n
+
+        old_height = height[u]
+        new_height = 2 * n
+        start = residual.offsets[u]
+        for e in range(start, residual.offsets[u + 1]):
+            if capacity[e] > 0 and height[heads[e]] + 1 < new_height:
+                new_height = height[heads[e]] + 1
+        self.current_arc[u] = start
+
+        self.count[old_height] -= 1
+        if self.count[old_height] == 0:
+            self._gap(old_height)
+            new_height = n
+
+        height[u] = new_height
+        if new_height < n:
+            self.count[new_height] += 1
+
+    def _discharge(self, u):
+        residual = self.residual
+        heads = residual.heads
+        capacity = residual.capacity
+        rev = residual.rev
+        end = residual.offsets[u + 1]
+        height = self.height
+        excess = self.excess
+        n = residual.n
+        relabels = 0
+
+        while excess[u] > 0:
+            e = self.current_arc[u]
+            if e == end:
+                self._relabel(u)
+                relabels += 1
+                if height[u] >= n:
+                    break
+                continue
+
+            v = heads[e]
+            if capacity[e] > 0 and height[u] == height[v] + 1:
+                delta = excess[u] if excess[u] < capacity[e] else capacity[e]
+                capacity[e] -= delta
+                capacity[rev[e]] += delta
+                if excess[v] == 0 and v != self.sink and v != self.source:
+                    self.buckets[height[v]].append(v)
+                    if height[v] > self.highest:
+                        self.highest = height[v]
+                excess[u] -= delta
+                excess[v] += delta
+            else:
+                self.current_arc[u] = e + 1
+
+        return relabels
+
+    def run(self):
+        residual = self.residual
+        source = self.source
+        capacity = residual.capacity
+        rev = residual.rev
+        heads = residual.heads
+        n = residual.n
+
+        for e in range(residual.offsets[source], residual.offsets[source + 1]):
+            delta = capacity[e]
+            if delta > 0:
+                v = heads[e]
+                capacity[e] = 0
+                capacity[rev[e]] += delta
+                self.excess[v] += delta
+                self.excess[source] -= delta
+
+        self._global_relabel()
+        relabels_since_global = 0
+        height = self.height
+        excess = self.excess
+        buckets = self.buckets
+
+        while self.highest >= 0:
+            bucket = buckets[self.highest]
+            if not bucket:
+                self.highest -= 1
+                continue
+
+            u = bucket.pop()
+            if height[u] != self.highest or excess[u] <= 0:
+                continue
+
+            relabels_since_global += self._discharge(u)
+
+            if relabels_since_global >= n:
+                self._global_relabel()
+                relabels_since_global = 0
+
+        return self.excess[self.sink]
+
+def push_relabel_ids(residual, source, sink):
+    if source == sink:
+        return 0
+    return _HighestLabelPushRelabel(residual, source, sink).run()
+
+def push_relabel(capacity_graph, source, sink):
+    residual = ResidualGraph.from_capacity_graph(capacity_graph)
+    if source not in residual.index or sink not in residual.index:
+        return 0
+    return push_relabel_ids(residual, residual.index[source], residual.index[sink])
+
+# --- Пример использования ---
+if __name__ == "__main__":
+    graph_capacities = {
+        's': {'a': 10, 'b': 10},
+        'a': {'c': 4, 'd': 8},
+        'b': {'a': 2, 'd': 9},
+        'c': {'t': 10},
+        'd': {'c': 6, 't': 10},
+        't': {}
+    }
+
+    max_flow_value = push_relabel(graph_capacities, 's', 't')
+    print(f"Максимальный поток (push-relabel) из 's' в 't': {max_flow_value}")
@@ -0,0 +1 @@
+"""Lowest common ancestor, range minimum query and strongly connected components."""
@@ -0,0 +1 @@
+"""Bipartite, general and stable matching algorithms."""
@@ -0,0 +1,243 @@
+# Shared-memory views attached once per pool worker by _attach_shared
+_shared = {}
+
+# Bid computations work on blocks of about this many matrix entries at a time
+_BLOCK_ENTRIES = 1 << 22
+
+def _top_two(values):
+    # Best index, best value and second-best value of every row of a 2-D array, from
+    # one argpartition: with kth=-2 the last two positions hold the runner-up and the
+    # maximum of each row
+    import numpy as np
+
+    rows = np.arange(len(values))
+    if values.shape[1] == 1:
+        return np.zeros(len(values), dtype=np.intp), values[:, 0], np.full(len(values), -np.inf)
+    top = np.argpartition(values, -2, axis=1)[:, -2:]
+    best = top[:, 1]
+    return best, values[rows, best], values[rows, top[:, 0]]
+
+def _forward_bids(cost, prices, rows):
+    # Persons (rows) look for the object maximizing a_ij - p_j with a = -cost
+    import numpy as np
+
+    step = max(1, _BLOCK_ENTRIES // cost.shape[1])
+    parts = []
+    for start in range(0, len(rows), step):
+        block = rows[start:start + step]
+        values = cost[block] + prices
+        np.negative(values, out=values)
+        parts.append(_top_two(values))
+    return tuple(np.concatenate(p) for p in zip(*parts))
+
+def _reverse_bids(cost, profits, cols):
+    # Objects (columns) look for the person maximizing a_ij - pi_i; column blocks are
+    # read straight from cost, so no transposed copy of the matrix is kept
+    import numpy as np
+
+    step = max(1, _BLOCK_ENTRIES // cost.shape[0])
+    parts = []
+    for start in range(0, len(cols), step):
+        block = cols[start:start + step]
+        values = cost[:, block]
+        values += profits[:, None]
+        np.negative(values, out=values)
+        parts.append(_top_two(np.ascontiguousarray(values.T)))
+    return tuple(np.concatenate(p) for p in zip(*parts))
+
+def _attach_shared(names):
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    for key, (name, shape, dtype) in names.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+def _forward_bids_shared(rows):
+    return _forward_bids(_shared['cost'][1], _shared['prices'][1], rows)
+
+def _reverse_bids_shared(cols):
+    return _reverse_bids(_shared['cost'][1], _shared['profits'][1], cols)
+
+def _winners(targets, offers):
+    # Highest offer per target; ties go to the first bidder
+    import numpy as np
+
+    order = np.lexsort((-offers, targets))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = targets[order[1:]] != targets[order[:-1]]
+    return order[first]
+
+def _dual_gap(cost, prices, col4row):
+    # Certified bound: with pi_i = max_j (a_ij - p_j) the duals are feasible, so
+    # sum(pi) + sum(p) bounds the best total benefit from above
+    import numpy as np
+
+    n = cost.shape[0]
+    best = np.concatenate([np.max(-(cost[start:start + 1024] + prices), axis=1)
+                           for start in range(0, n, 1024)]) if n else np.zeros(0)
+    benefit = -cost[np.arange(n), col4row].sum()
+    return max(0.0, float(best.sum() + prices.sum() - benefit))
+
+def auction_assignment(cost_matrix, tolerance=1e-6, scaling=10.0, workers=1):
+    """
+    Forward/reverse auction algorithm with epsilon scaling for square assignment problems.
+
+    Parameters:
+    cost_matrix: n x n array-like of finite costs
+    tolerance: Target optimality gap relative to the cost range; the last scaling phase
+               uses epsilon = tolerance * (max - min) / n, so the gap is at most
+               n * epsilon. Integer costs with epsilon < 1 / n are solved exactly
+    scaling: Factor by which epsilon shrinks between phases
+    workers: Number of worker processes; with more than one, the cost matrix, prices
+             and profits are placed in shared memory and every bid round is computed
+             over row (or column) slices on a ProcessPoolExecutor
+
+    Returns:
+    (row_ind, col_ind, gap): the assignment in the convention of hungarian_algorithm
+    and a certified upper bound on its distance from the optimal total cost
+
+    Each round lets every unassigned row bid for its best column (forward) or every
+    unassigned column bid for its best row (reverse), all at once: values and the top
+    two per bidder come from one argpartition over a block of rows (or columns) read
+    straight from the cost matrix. Conflicts go to the highest bid. The direction
+    switches whenever a round has increased the number of assigned pairs, which keeps
+    the combined method from cycling.
+
+    No transposed copy is made: a float64 cost_matrix is used as is when workers is 1,
+    and copied once into shared memory otherwise.
+    """
+    import numpy as np
+
+    cost = np.asarray(cost_matrix, dtype=float)
+    n, m = cost.shape
+    if n != m:
+        raise ValueError(f"auction_assignment needs a square cost matrix, got {n} x {m}")
+    if not np.isfinite(cost).all():
+        raise ValueError("auction_assignment needs finite costs")
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), 0.0
+
+    spread = float(cost.max() - cost.min())
+    final_epsilon = max(tolerance * spread, np.finfo(float).eps) / n
+    epsilon = max(spread / 2, final_epsilon)
+
+    pool = None
+    blocks = {}
+    arrays = {}
+    try:
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import shared_memory
+
+            for key, shape in (('cost', cost.shape), ('prices', (n,)), ('profits', (n,))):
+                blocks[key] = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+                arrays[key] = np.ndarray(shape, dtype=np.float64, buffer=blocks[key].buf)
+            arrays['cost'][:] = cost
+            cost = arrays['cost']
+            prices, profits = arrays['prices'], arrays['profits']
+            prices[:] = 0.0
+            names = {key: (block.name, arrays[key].shape, arrays[key].dtype) for key, block in blocks.items()}
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared, initargs=(names,))
+
+            def bids(task, bidders):
+                parts = list(pool.map(task, np.array_split(bidders, min(workers, len(bidders)))))
+                return tuple(np.concatenate(p) for p in zip(*parts))
+
+            def forward(rows):
+                return bids(_forward_bids_shared, rows)
+
+            def reverse(cols):
+                return bids(_reverse_bids_shared, cols)
+        else:
+            prices = np.zeros(n)
+            profits = np.zeros(n)
+
+            def forward(rows):
+                return _forward_bids(cost, prices, rows)
+
+            def reverse(cols):
+                return _reverse_bids(cost, profits, cols)
+
+        col4row = np.full(n, -1)
+        row4col = np.full(n, -1)
+        while True:
+            # New phase: prices carry over, and a pair stays assigned only if it still
+            # satisfies epsilon-CS for the new epsilon; profits of all other rows are
+            # reset to their best value, which makes every pair epsilon-CS again
+            for start in range(0, n, 1024):
+                profits[start:start + 1024] = np.max(-(cost[start:start + 1024] + prices), axis=1)
+            rows = np.flatnonzero(col4row >= 0)
+            kept_profit = -cost[rows, col4row[rows]] - prices[col4row[rows]]
+            stale = kept_profit < profits[rows] - epsilon
+            row4col[col4row[rows[stale]]] = -1
+            col4row[rows[stale]] = -1
+            profits[rows[~stale]] = kept_profit[~stale]
+            assigned = int((col4row >= 0).sum())
+            direction_start = assigned
+            is_forward = True
+
+            while assigned < n:
+                if is_forward:
+                    rows = np.flatnonzero(col4row == -1)
+                    cols, best, second = forward(rows)
+                    offers = prices[cols] + best - second + epsilon
+                    offers[~np.isfinite(offers)] = prices[cols[~np.isfinite(offers)]] + spread + epsilon
+                    win = _winners(cols, offers)
+                    rows, cols, offers = rows[win], cols[win], offers[win]
+                    previous = row4col[cols]
+                    col4row[previous[previous >= 0]] = -1
+                    assigned += int((previous < 0).sum())
+                    row4col[cols] = rows
+                    col4row[rows] = cols
+                    prices[cols] = offers
+                    profits[rows] = -cost[rows, cols] - offers
+                else:
+                    cols = np.flatnonzero(row4col == -1)
+                    rows, best, second = reverse(cols)
+                    second = np.where(np.isfinite(second), second, best - spread)
+                    offers = -cost[rows, cols] - second + epsilon
+                    win = _winners(rows, offers)
+                    rows, cols, offers = rows[win], cols[win], offers[win]
+                    previous = col4row[rows]
+                    row4col[previous[previous >= 0]] = -1
+                    assigned += int((previous < 0).sum())
+                    col4row[rows] = cols
+                    row4col[cols] = rows
+                    profits[rows] = offers
+                    prices[cols] = -cost[rows, cols] - offers
+
+                if assigned > direction_start:
+                    direction_start = assigned
+                    is_forward = not is_forward
+
+            if epsilon <= final_epsilon:
+                break
+            epsilon = max(epsilon / scaling, final_epsilon)
+
+        gap = _dual_gap(cost, prices, col4row)
+        return col4row.copy(), row4col.copy(), gap
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        # Views into the shared blocks must go before the blocks can be closed
+        cost = prices = profits = None
+        arrays.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+if __name__ == "__main__":
+    import numpy as np
+
+    cost_matrix = np.array([
+        [7, 5, 9, 8],
+        [9, 4, 3, 7],
+        [9, 9, 5, 6],
+        [3, 8, 6, 9]
+    ])
+
+    row_ind, col_ind, gap = auction_assignment(cost_matrix)
+    print("Assignment (row -> column):", row_ind.tolist())
+    print("Total cost:", cost_matrix[np.arange(len(row_ind)), row_ind].sum(), "gap bound:", gap)
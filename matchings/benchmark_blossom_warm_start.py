@@ -0,0 +1,37 @@
+import random
+import time
+
+from .edmonds_blossom import BlossomMatcher
+
+def random_sparse_graph(n, average_degree, seed=0):
+    rng = random.Random(seed)
+    edges = set()
+    target = n * average_degree // 2
+    while len(edges) < target:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.add((u, v) if u < v else (v, u))
+    return list(edges)
+
+def run(n, edges, warm_start):
+    matcher = BlossomMatcher(n, edges)
+    start = time.perf_counter()
+    seeded = 0
+    if warm_start:
+        matcher.seed_greedy()
+        seeded = sum(1 for v, w in enumerate(matcher.match) if w > v)
+    seed_time = time.perf_counter() - start
+    size = matcher.solve()
+    total_time = time.perf_counter() - start
+    return size, seeded, matcher.searches, matcher.augmentations, seed_time, total_time
+
+if __name__ == "__main__":
+    for n, average_degree in [(10_000, 3), (50_000, 4), (200_000, 6)]:
+        edges = random_sparse_graph(n, average_degree)
+        print(f"Graph: n = {n}, m = {len(edges)}")
+        for warm_start in (False, True):
+            size, seeded, searches, augmentations, seed_time, total_time = run(n, edges, warm_start)
+            name = 'greedy warm start' if warm_start else 'empty matching'
+            print(f"  {name:<18} size = {size}, seeded = {seeded}, searches = {searches}, "
+                  f"augmentations = {augmentations}, seeding = {seed_time:.3f} s, "
+                  f"total = {total_time:.3f} s")
@@ -0,0 +1,80 @@
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from flows.edmonds_karp import edmonds_karp
+
+from .edmonds_blossom import edmonds_blossom
+from .hopcroft_karp import hopcroft_karp, hopcroft_karp_edges
+
+def random_bipartite(n, average_degree, seed=0):
+    rng = np.random.default_rng(seed)
+    left = rng.integers(0, n, n * average_degree)
+    right = rng.integers(0, n, n * average_degree)
+    return left, right
+
+def hopcroft_karp_dict(n, left, right):
+    graph = {u: [] for u in range(n)}
+    for u, v in zip(left.tolist(), right.tolist()):
+        graph[u].append(v)
+    return len(hopcroft_karp(graph))
+
+def hopcroft_karp_arrays(n, left, right):
+    row_ind, _ = hopcroft_karp_edges(left, right, n, n)
+    return int((row_ind >= 0).sum())
+
+def blossom(n, left, right):
+    # Right vertex v becomes n + v in one undirected graph
+    graph = {u: [] for u in range(2 * n)}
+    for u, v in zip(left.tolist(), right.tolist()):
+        graph[u].append(n + v)
+        graph[n + v].append(u)
+    return len(edmonds_blossom(graph)) // 2
+
+def max_flow_reduction(n, left, right):
+    # Unit capacities source -> left -> right -> sink; the flow value is the matching size
+    capacity = {'s': {('L', u): 1 for u in range(n)}, 't': {}}
+    for u in range(n):
+        capacity[('L', u)] = {}
+        capacity[('R', u)] = {'t': 1}
+    for u, v in zip(left.tolist(), right.tolist()):
+        capacity[('L', u)][('R', v)] = 1
+    return edmonds_karp(capacity, 's', 't')
+
+def _timed(solver, args, results):
+    start = time.perf_counter()
+    size = solver(*args)
+    results.put((time.perf_counter() - start, size))
+
+def run_with_timeout(solver, args, timeout):
+    # Each solver gets a fresh process, so a slow baseline is stopped after the timeout
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_timed, args=(solver, args, results))
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return None
+    return results.get()
+
+if __name__ == "__main__":
+    timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 120.0
+    solvers = [
+        ('Hopcroft-Karp (edge arrays)', hopcroft_karp_arrays),
+        ('Hopcroft-Karp (dict)', hopcroft_karp_dict),
+        ('edmonds_blossom', blossom),
+        ('edmonds_karp reduction', max_flow_reduction),
+    ]
+    for n, average_degree in [(2_000, 3), (10_000, 3), (50_000, 3)]:
+        left, right = random_bipartite(n, average_degree, seed=n)
+        print(f"Bipartite graph: {n} + {n} vertices, {len(left)} edges")
+        for name, solver in solvers:
+            result = run_with_timeout(solver, (n, left, right), timeout)
+            if result is None:
+                print(f"  {name:<28} stopped after {timeout:.0f} s")
+            else:
+                elapsed, size = result
+                print(f"  {name:<28} size = {size}, time = {elapsed:.3f} s")
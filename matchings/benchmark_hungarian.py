@@ -0,0 +1,49 @@
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from .hungarian import hungarian_algorithm, hungarian_shortest_path
+
+def _timed(solver, cost, results):
+    start = time.perf_counter()
+    row_ind, _ = solver(cost)
+    results.put((time.perf_counter() - start, np.asarray(row_ind)))
+
+def run_with_timeout(solver, cost, timeout):
+    # The original solver can take minutes (or loop) on larger inputs, so it runs
+    # in a child process that is stopped after the timeout
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_timed, args=(solver, cost, results))
+    process.start()
+    process.join(timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        return None
+    return results.get()
+
+def describe(cost, row_ind):
+    n = cost.shape[0]
+    valid = len(set(row_ind.tolist())) == n and row_ind.min() >= 0
+    total = cost[np.arange(n), row_ind].sum()
+    return f"cost = {total:.4f}" + ("" if valid else " (not a valid assignment)")
+
+if __name__ == "__main__":
+    timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 120.0
+    rng = np.random.default_rng(0)
+    for n in (100, 500, 2000):
+        cost = rng.random((n, n))
+        print(f"n = {n}")
+
+        start = time.perf_counter()
+        row_ind, _ = hungarian_shortest_path(cost)
+        print(f"  shortest augmenting path  {time.perf_counter() - start:9.3f} s, {describe(cost, row_ind)}")
+
+        result = run_with_timeout(hungarian_algorithm, cost, timeout)
+        if result is None:
+            print(f"  hungarian_algorithm       stopped after {timeout:.0f} s")
+        else:
+            elapsed, row_ind = result
+            print(f"  hungarian_algorithm       {elapsed:9.3f} s, {describe(cost, row_ind)}")
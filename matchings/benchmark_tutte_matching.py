@@ -0,0 +1,41 @@
+import random
+import time
+import warnings
+
+from .edmonds_blossom import edmonds_blossom
+from .tutte_matching import get_maximum_matching_size_randomized
+
+def random_graph(n, average_degree, seed=0):
+    rng = random.Random(seed)
+    edges = set()
+    target = n * average_degree // 2
+    while len(edges) < target:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.add((u, v) if u < v else (v, u))
+    return list(edges)
+
+def timed(n, edges, exact):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        start = time.perf_counter()
+        size = get_maximum_matching_size_randomized(n, edges, exact=exact)
+        elapsed = time.perf_counter() - start
+    return size, elapsed, len(caught)
+
+if __name__ == "__main__":
+    for n, average_degree in [(500, 3), (1_000, 3), (2_000, 3), (3_000, 3), (4_000, 3)]:
+        edges = random_graph(n, average_degree, seed=n)
+        graph = {v: [] for v in range(n)}
+        for u, v in edges:
+            graph[u].append(v)
+            graph[v].append(u)
+        expected = len(edmonds_blossom(graph)) // 2
+        print(f"Graph: n = {n}, m = {len(edges)}, maximum matching (blossom) = {expected}")
+
+        for name, exact in (('float64 SVD rank', False), ('rank mod p', True)):
+            size, elapsed, warned = timed(n, edges, exact)
+            note = "" if size == expected else "  [differs from blossom]"
+            if warned:
+                note += "  [odd rank warning]"
+            print(f"  {name:<17} size = {size}, time = {elapsed:.3f} s{note}")
@@ -0,0 +1,67 @@
+import random
+import time
+
+from .hungarian import hungarian_algorithm
+from .weighted_blossom import max_weight_matching_ids
+
+def random_weighted_graph(n, average_degree, max_weight=100, seed=0):
+    rng = random.Random(seed)
+    weights = {}
+    target = n * average_degree // 2
+    while len(weights) < target:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            weights[(u, v) if u < v else (v, u)] = rng.randint(1, max_weight)
+    return [(u, v, w) for (u, v), w in weights.items()]
+
+def doubled_hungarian(n, edges):
+    # The workaround: a 2n x 2n cost matrix whose top-left block holds -w(u, v) in both
+    # orientations, with one private zero-cost dummy per vertex for "unmatched".
+    # Its optimum is the symmetric 2-matching bound, which may contain odd cycles, so
+    # only the pairs the assignment chose in both directions form a valid matching.
+    import numpy as np
+
+    forbidden = 1 + 2 * sum(w for _, _, w in edges)
+    cost = np.full((2 * n, 2 * n), float(forbidden))
+    for u, v, w in edges:
+        cost[u, v] = cost[v, u] = -w
+    cost[np.arange(n), n + np.arange(n)] = 0
+    cost[n + np.arange(n), np.arange(n)] = 0
+    cost[n:, n:] = 0
+
+    row_ind, col_ind = hungarian_algorithm(cost)
+    is_permutation = len(set(col_ind.tolist())) == 2 * n and col_ind.min() >= 0
+    bound = -cost[np.arange(2 * n), col_ind].sum() / 2
+    weight = {(u, v): w for u, v, w in edges}
+    recovered = sum(weight[(u, v)] for u in range(n) for v in [int(col_ind[u])]
+                    if u < v < n and col_ind[v] == u)
+    return bound, recovered, is_permutation
+
+def matching_weight(mate, edges):
+    return sum(w for u, v, w in edges if mate[u] == v)
+
+if __name__ == "__main__":
+    for n, average_degree in [(10, 4), (20, 4), (40, 4)]:
+        edges = random_weighted_graph(n, average_degree, seed=n)
+        print(f"Graph: n = {n}, m = {len(edges)}")
+
+        start = time.perf_counter()
+        mate = max_weight_matching_ids(n, edges)
+        blossom_time = time.perf_counter() - start
+        print(f"  weighted blossom    weight = {matching_weight(mate, edges)}, time = {blossom_time:.4f} s")
+
+        start = time.perf_counter()
+        bound, recovered, is_permutation = doubled_hungarian(n, edges)
+        hungarian_time = time.perf_counter() - start
+        print(f"  doubled Hungarian   bound = {bound:g}, recovered matching = {recovered}, "
+              f"time = {hungarian_time:.4f} s"
+              + ("" if is_permutation else "  [assignment is not a permutation]"))
+
+    for n, average_degree in [(1_000, 8), (3_000, 8)]:
+        edges = random_weighted_graph(n, average_degree, seed=n)
+        start = time.perf_counter()
+        mate = max_weight_matching_ids(n, edges)
+        blossom_time = time.perf_counter() - start
+        print(f"Graph: n = {n}, m = {len(edges)}: weighted blossom weight = "
+              f"{matching_weight(mate, edges)}, time = {blossom_time:.3f} s "
+              f"(doubled Hungarian would need a {2 * n}x{2 * n} dense matrix)")
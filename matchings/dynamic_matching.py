@@ -0,0 +1,195 @@
+from collections import deque
+
+from .edmonds_blossom import BlossomMatcher, relabel_graph
+
+class DynamicMatching(BlossomMatcher):
+    """
+    Maximum matching of a general graph kept current under edge insertions and deletions.
+
+    Adjacency is stored as one set per integer vertex, so edges can be added and removed
+    in O(1); new vertices are numbered on first use. Every update runs at most one
+    alternating-forest search (two after deleting a matched edge), grown only from the
+    vertices an augmenting path would have to start from:
+
+    - inserting (u, v) with both ends free matches them directly, and with one end free
+      it searches from that end;
+    - inserting (u, v) with both ends matched can only grow the matching along a path
+      that reaches u through u's matched edge from a free vertex, and v likewise. A
+      reverse alternating walk from each end collects those free vertices; if either
+      side has none the edge cannot help, otherwise one forest is grown from the
+      smaller side only, since every such path has an end there;
+    - deleting an unmatched edge never invalidates a maximum matching;
+    - deleting a matched edge frees u and v, and any new augmenting path has to end at
+      one of them, so only u and v are searched from.
+
+    A search costs the alternating region it explores, so an update only touches the
+    part of the graph alternating paths from its endpoints can reach.
+
+    Parameters:
+    graph: Optional adjacency dictionary in the same format as edmonds_blossom; the
+           initial maximum matching is computed with one static solve
+
+    Attributes:
+    searches: Number of augmenting-path searches run so far
+    augmentations: Number of searches that grew the matching
+    """
+
+    def __init__(self, graph=None):
+        labels, index, edges = relabel_graph(graph or {})
+        self.n = len(labels)
+        self.labels = labels
+        self.index = index
+        self.adjacency = [set() for _ in labels]
+        for a, b in edges:
+            self.adjacency[a].add(b)
+            self.adjacency[b].add(a)
+
+        self._init_state()
+        self.free = set()
+
+        self.solve()
+        self.free.update(v for v in range(self.n) if self.match[v] == -1)
+
+    def _neighbors(self, v):
+        return self.adjacency[v]
+
+    def _augment(self, v):
+        # v is the free vertex at the far end of the augmenting path
+        self.free.discard(v)
+        super()._augment(v)
+
+    def _vertex(self, label):
+        v = self.index.get(label)
+        if v is None:
+            v = self._add_vertex()
+            self.index[label] = v
+            self.labels.append(label)
+            self.adjacency.append(set())
+            self.free.add(v)
+        return v
+
+    def edges(self):
+        return [(u, w) for u in range(self.n) for w in self.adjacency[u] if w > u]
+
+    def _free_reaching(self, v):
+        # Free vertices from which an alternating walk ends with v's matched edge; an
+        # augmenting path through an unmatched edge at v must start at one of them.
+        # Walks are followed per vertex and parity, so blossoms cannot hide a path
+        self._lca_stamp += 1
+        stamp = self._lca_stamp
+        mark = self._mark
+        match = self.match
+        adjacency = self.adjacency
+
+        roots = set()
+        x = match[v]
+        mark[x] = stamp
+        queue = deque([x])
+        while queue:
+            x = queue.popleft()
+            for u in adjacency[x]:
+                y = match[u]
+                if y == -1:
+                    roots.add(u)
+                elif u != match[x] and mark[y] != stamp:
+                    mark[y] = stamp
+                    queue.append(y)
+        return roots
+
+    def _run(self, roots):
+        self.searches += 1
+        if self.search(roots):
+            self.augmentations += 1
+            # Exactly one root of the forest was matched by the augmentation
+            match = self.match
+            self.free.difference_update([r for r in roots if match[r] != -1])
+            return True
+        return False
+
+    def insert_edge(self, u, v):
+        """
+        Adds the undirected edge (u, v) and restores maximality with at most one search.
+        Returns True if the matching grew.
+        """
+        a, b = self._vertex(u), self._vertex(v)
+        if a == b or b in self.adjacency[a]:
+            return False
+        self.adjacency[a].add(b)
+        self.adjacency[b].add(a)
+
+        match = self.match
+        if match[a] == -1 and match[b] == -1:
+            match[a] = b
+            match[b] = a
+            self.free.discard(a)
+            self.free.discard(b)
+            return True
+        if match[a] == -1:
+            return self._run((a,))
+        if match[b] == -1:
+            return self._run((b,))
+        side_a = self._free_reaching(a)
+        if not side_a:
+            return False
+        side_b = self._free_reaching(b)
+        if not side_b:
+            return False
+        # Every augmenting path through (u, v) has one end on each side
+        return self._run(list(min(side_a, side_b, key=len)))
+
+    def delete_edge(self, u, v):
+        """
+        Removes the undirected edge (u, v); if it was matched, searches again from its
+        two freed endpoints only. Returns True if the matching shrank.
+        """
+        a, b = self.index.get(u), self.index.get(v)
+        if a is None or b is None or b not in self.adjacency[a]:
+            raise KeyError(f"Edge ({u!r}, {v!r}) is not in the graph")
+        self.adjacency[a].discard(b)
+        self.adjacency[b].discard(a)
+
+        match = self.match
+        if match[a] != b:
+            return False
+        match[a] = match[b] = -1
+        self.free.update((a, b))
+        # If the search from a fails, b is still free; a success from either side
+        # restores the previous size
+        return not (self._run((a,)) or self._run((b,)))
+
+    def __len__(self):
+        return (self.n - len(self.free)) // 2
+
+    def mate(self, u):
+        v = self.index.get(u)
+        if v is None or self.match[v] == -1:
+            return None
+        return self.labels[self.match[v]]
+
+    def matching(self):
+        """
+        Returns the current matching as a dictionary, in the same format as edmonds_blossom.
+        """
+        labels = self.labels
+        return {labels[v]: labels[w] for v, w in enumerate(self.match) if w != -1}
+
+if __name__ == "__main__":
+
+    graph = {
+        0: [1, 2],
+        1: [0, 2, 3],
+        2: [0, 1, 3, 4],
+        3: [1, 2, 5],
+        4: [2, 5],
+        5: [3, 4]
+    }
+
+    dynamic = DynamicMatching(graph)
+    print("Initial matching:", dynamic.matching(), "size", len(dynamic))
+
+    dynamic.delete_edge(*next(iter(dynamic.matching().items())))
+    print("After deleting a matched edge:", dynamic.matching(), "size", len(dynamic))
+
+    dynamic.insert_edge(6, 7)
+    dynamic.insert_edge(5, 6)
+    print("After inserting (6, 7) and (5, 6):", dynamic.matching(), "size", len(dynamic))
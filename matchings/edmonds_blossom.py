@@ -1,143 +1,323 @@
-def edmonds_blossom(graph):
+from collections import deque
+
+from flows.greedy_matching import greedy_maximal_matching
+
+class BlossomMatcher:
+    """
+    Iterative engine for Edmonds' Blossom Algorithm on integer-relabeled vertices.
+
+    The graph is stored as CSR arrays (offsets, targets) over vertices 0 .. n-1.
+    Alternating trees are grown with an explicit BFS queue, and blossoms are never
+    contracted into a new graph: each vertex points to its blossom base through a
+    union-find forest, so shrinking a blossom is a handful of unions. One search
+    per free vertex costs O(E * alpha(V)), which gives O(V * E * alpha(V)) overall.
+
+    Parameters:
+    n: Number of vertices
+    edges: Iterable of (u, v) pairs with 0 <= u, v < n; self-loops are ignored
+
+    Attributes:
+    match: match[v] is the vertex matched to v, or -1 if v is free
+    searches: Number of augmenting-path searches run so far
+    augmentations: Number of searches that grew the matching
+    """
+
+    def __init__(self, n, edges):
+        self.n = n
+
+        offsets = [0] * (n + 1)
+        pairs = [(u, v) for u, v in edges if u != v]
+        for u, v in pairs:
+            offsets[u + 1] += 1
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        targets = [0] * offsets[n]
+        position = offsets[:n]
+        for u, v in pairs:
+            targets[position[u]] = v
+            position[u] += 1
+            targets[position[v]] = u
+            position[v] += 1
+
+        self.offsets = offsets
+        self.targets = targets
+        self._init_state()
+
+    def _init_state(self):
+        # Empty matching and counters for self.n vertices; subclasses that keep their
+        # own adjacency call this instead of building the CSR arrays
+        n = self.n
+        self.match = [-1] * n
+        self.searches = 0
+        self.augmentations = 0
+
+        # Per-search state, allocated once and reset only where a search touched it
+        self._pred = [-1] * n
+        self._uf = list(range(n))
+        self._even = [0] * n
+        self._mark = [0] * n
+        self._tree = [0] * n
+        self._search = 0
+        self._lca_stamp = 0
+
+    def _add_vertex(self):
+        # Appends one free vertex to the matching and per-search state and returns its
+        # id; only for subclasses whose _neighbors can grow with it
+        v = self.n
+        self.n += 1
+        self.match.append(-1)
+        self._pred.append(-1)
+        self._uf.append(v)
+        self._even.append(0)
+        self._mark.append(0)
+        self._tree.append(0)
+        return v
+
+    def edges(self):
+        offsets = self.offsets
+        targets = self.targets
+        return [(u, targets[k]) for u in range(self.n)
+                for k in range(offsets[u], offsets[u + 1]) if targets[k] > u]
+
+    def set_matching(self, pairs):
+        """
+        Replaces the current matching with the given (u, v) pairs after checking
+        that every pair is an edge and no vertex is used twice.
+        """
+        match = [-1] * self.n
+        for u, v in pairs:
+            if not (0 <= u < self.n and 0 <= v < self.n):
+                raise ValueError(f"Matched pair ({u}, {v}) is out of range for n={self.n}")
+            if match[u] != -1 or match[v] != -1 or u == v:
+                raise ValueError(f"Vertex in pair ({u}, {v}) is matched more than once")
+            if v not in self._neighbors(u):
+                raise ValueError(f"Matched pair ({u}, {v}) is not an edge of the graph")
+            match[u] = v
+            match[v] = u
+        self.match[:] = match
+
+    def seed_greedy(self):
+        """
+        Starts from greedy_maximal_matching over the graph's edges, so that only
+        the remaining augmentations have to be searched for.
+        """
+        self.set_matching(greedy_maximal_matching(range(self.n), self.edges()))
+
+    def _find(self, v):
+        uf = self._uf
+        root = v
+        while uf[root] != root:
+            root = uf[root]
+        while uf[v] != root:
+            uf[v], v = root, uf[v]
+        return root
+
+    def _lca(self, a, b):
+        # Walk both tree paths towards the root in alternation; the first base
+        # reached by both walks is the base of the new blossom
+        self._lca_stamp += 1
+        stamp = self._lca_stamp
+        mark = self._mark
+        match = self.match
+        pred = self._pred
+        a, b = self._find(a), self._find(b)
+        while True:
+            if a != -1:
+                if mark[a] == stamp:
+                    return a
+                mark[a] = stamp
+                a = self._find(pred[match[a]]) if match[a] != -1 else -1
+            a, b = b, a
+
+    def _shrink_path(self, v, base, child, queue, members):
+        # Walk from v up to the blossom base; odd vertices on the way become even,
+        # every visited vertex is collected for merging into the base's set, and
+        # pred is pointed across the bridge so the augmenting path can be read back
+        # later. The merge waits until both walks are done: merging early would make
+        # a nested blossom on the path look like part of the new one and end the walk
+        # before its base, leaving the odd vertex above it unlabelled
+        match = self.match
+        pred = self._pred
+        even = self._even
+        search = self._search
+        while self._find(v) != base:
+            mate = match[v]
+            pred[v] = child
+            members.append(v)
+            members.append(mate)
+            if even[mate] != search:
+                even[mate] = search
+                self._tree[mate] = self._tree[base]
+                queue.append(mate)
+            child = mate
+            v = pred[mate]
+
+    def _augment(self, v):
+        match = self.match
+        pred = self._pred
+        while v != -1:
+            pv = pred[v]
+            ppv = match[pv]
+            match[v] = pv
+            match[pv] = v
+            v = ppv
+
+    def _neighbors(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def _join(self, v, w):
+        # Even-even edge between two different trees: flip both tree paths
+        # towards their roots, then match v with w
+        match = self.match
+        for x in (v, w):
+            if match[x] != -1:
+                self._augment(match[x])
+        match[v] = w
+        match[w] = v
+
+    def augment_from(self, root):
+        """
+        Searches for an augmenting path from the free vertex root with one BFS and
+        applies it. Returns True if the matching grew.
+        """
+        return self.search((root,))
+
+    def search(self, roots):
+        """
+        Grows one alternating forest from the given free vertices and applies the
+        first augmenting path found, which either ends at an unlabelled free vertex
+        or joins two of the trees. Returns True if the matching grew.
+        """
+        match = self.match
+        pred = self._pred
+        even = self._even
+        tree = self._tree
+        find = self._find
+        neighbors = self._neighbors
+
+        # even[v] == search marks the even (outer) vertices of the current forest,
+        # tree[v] is the root of an even vertex's tree
+        self._search += 1
+        search = self._search
+        touched = list(roots)
+        queue = deque(roots)
+        for root in roots:
+            even[root] = search
+            tree[root] = root
+
+        try:
+            while queue:
+                v = queue.popleft()
+                for w in neighbors(v):
+                    if match[v] == w or find(v) == find(w):
+                        continue
+                    if even[w] == search:
+                        if tree[w] != tree[v]:
+                            self._join(v, w)
+                            return True
+                        # Even-even edge between different blossoms of one tree: shrink
+                        base = self._lca(v, w)
+                        members = []
+                        self._shrink_path(v, base, w, queue, members)
+                        self._shrink_path(w, base, v, queue, members)
+                        uf = self._uf
+                        for x in members:
+                            uf[find(x)] = base
+                    elif pred[w] == -1:
+                        # w joins the tree as an odd vertex
+                        pred[w] = v
+                        touched.append(w)
+                        if match[w] == -1:
+                            self._augment(w)
+                            return True
+                        mate = match[w]
+                        even[mate] = search
+                        tree[mate] = tree[v]
+                        touched.append(mate)
+                        queue.append(mate)
+            return False
+        finally:
+            uf = self._uf
+            for x in touched:
+                pred[x] = -1
+                uf[x] = x
+
+    def solve(self):
+        """
+        Runs one search from every free vertex. A vertex whose search fails stays
+        unmatchable for the rest of the run, so a single pass is enough.
+        Returns the number of matched pairs.
+        """
+        match = self.match
+        for v in range(self.n):
+            if match[v] == -1:
+                self.searches += 1
+                if self.augment_from(v):
+                    self.augmentations += 1
+        return sum(1 for v in range(self.n) if match[v] > v)
+
+def relabel_graph(graph, weighted=False):
+    """
+    Maps the vertices of an adjacency dictionary to 0 .. n-1.
+
+    Returns (labels, index, edges): labels[i] is the original vertex, index is the
+    inverse mapping and edges is the set of undirected (a, b) pairs with a < b. With
+    weighted=True every value of graph is a {neighbor: weight} dictionary and edges
+    maps each pair to the heaviest weight given for it.
+    """
+    labels = []
+    index = {}
+    for u, neighbors in graph.items():
+        for w in (u, *neighbors):
+            if w not in index:
+                index[w] = len(labels)
+                labels.append(w)
+
+    edges = {} if weighted else set()
+    for u, neighbors in graph.items():
+        a = index[u]
+        for w in neighbors:
+            b = index[w]
+            if a == b:
+                continue
+            key = (a, b) if a < b else (b, a)
+            if not weighted:
+                edges.add(key)
+            elif key not in edges or neighbors[w] > edges[key]:
+                edges[key] = neighbors[w]
+
+    return labels, index, edges
+
+def edmonds_blossom(graph, initial_matching=None):
     """
     Implements Edmonds' Blossom Algorithm for finding maximum cardinality matching in general graphs.
-    
+
     Parameters:
     graph: Dictionary representing an undirected graph where keys are vertices and values are
            lists of adjacent vertices
-    
+    initial_matching: Optional warm start, either a matching dictionary in the same format as
+           the result (validated before use) or 'greedy' to seed with greedy_maximal_matching
+
     Returns:
     A dictionary representing the matching, where keys and values are matched vertices
     """
+    labels, index, edges = relabel_graph(graph)
+    matcher = BlossomMatcher(len(labels), edges)
+    if initial_matching == 'greedy':
+        matcher.seed_greedy()
+    elif initial_matching is not None:
+        try:
+            pairs = [(index[u], index[v]) for u, v in initial_matching.items()]
+        except KeyError as e:
+            raise ValueError(f"Initial matching uses unknown vertex {e.args[0]!r}") from None
+        for u, v in pairs:
+            if initial_matching.get(labels[v]) != labels[u]:
+                raise ValueError(f"Initial matching is not symmetric at ({labels[u]!r}, {labels[v]!r})")
+        matcher.set_matching([(u, v) for u, v in pairs if u < v])
+    matcher.solve()
 
-    matching = {}
-
-    def find_augmenting_path(v, visited, path):
-        visited.add(v)
-        
-        for neighbor in graph[v]:
-            # Skip if we've already visited this neighbor
-            if neighbor in visited:
-                continue
-
-            if neighbor not in matching or (neighbor in matching and matching[neighbor] == v):
-                if v not in matching or (v in matching and matching[v] != neighbor):
-                    path.append((v, neighbor))
-                    return True
-
-            if neighbor in matching:
-                matched_to = matching[neighbor]
-                if matched_to not in visited:
-                    path.append((v, neighbor))
-                    path.append((neighbor, matched_to))
-                    if find_augmenting_path(matched_to, visited, path):
-                        return True
-
-                    path.pop()
-                    path.pop()
-        
-        return False
-
-    def contract_blossom(blossom, v, blossom_base):
-
-        contracted_graph = {}
-        for vertex in graph:
-            if vertex in blossom and vertex != blossom_base:
-                continue
-            contracted_graph[vertex] = []
-            for neighbor in graph[vertex]:
-                if neighbor in blossom:
-                    if blossom_base not in contracted_graph[vertex]:
-                        contracted_graph[vertex].append(blossom_base)
-                else:
-                    contracted_graph[vertex].append(neighbor)
-        
-        return contracted_graph
-
-    def find_blossom(v, visited, parent):
-        visited.add(v)
-        
-        for neighbor in graph[v]:
-            if neighbor == parent:
-                continue
-                
-            if neighbor in visited:
-
-                blossom = [neighbor, v]
-                current = v
-                while current != neighbor:
-                    current = parent[current]
-                    blossom.append(current)
-                return blossom
-            
-            parent[neighbor] = v
-            result = find_blossom(neighbor, visited, parent)
-            if result:
-                return result
-        
-        return None
-
-    while True:
-
-        augmenting_path = []
-        visited = set()
-
-        found_path = False
-        for v in graph:
-            if v not in matching:
-                if find_augmenting_path(v, visited, augmenting_path):
-                    found_path = True
-                    break
-        
-        if not found_path:
-
-            for v in graph:
-                blossom = find_blossom(v, set(), {v: None})
-                if blossom:
-
-                    blossom_base = blossom[0]
-                    contracted_graph = contract_blossom(blossom, v, blossom_base)
-
-                    temp_matching = edmonds_blossom(contracted_graph)
-
-                    for a, b in temp_matching.items():
-                        if a == blossom_base:
-
-                            for blossom_vertex in blossom:
-                                if b in graph[blossom_vertex]:
-                                    matching[blossom_vertex] = b
-                                    matching[b] = blossom_vertex
-                                    break
-                        elif b == blossom_base:
-
-                            for blossom_vertex in blossom:
-                                if a in graph[blossom_vertex]:
-                                    matching[a] = blossom_vertex
-                                    matching[blossom_vertex] = a
-                                    break
-                        else:
-                            matching[a] = b
-                            matching[b] = a
-                    
-                    return matching
-
-            break
-
-        for i in range(0, len(augmenting_path), 2):
-            u, v = augmenting_path[i]
-
-            if u in matching:
-                del matching[matching[u]]
-                del matching[u]
-
-            if v in matching:
-                del matching[matching[v]]
-                del matching[v]
-
-            matching[u] = v
-            matching[v] = u
-    
-    return matching
+    return {labels[v]: labels[w] for v, w in enumerate(matcher.match) if w != -1}
 
 if __name__ == "__main__":
 
@@ -149,6 +329,9 @@ if __name__ == "__main__":
         4: [2, 5],
         5: [3, 4]
     }
-    
+
     matching = edmonds_blossom(graph)
     print("Maximum matching:", matching)
+
+    matching = edmonds_blossom(graph, initial_matching='greedy')
+    print("Maximum matching (greedy warm start):", matching)
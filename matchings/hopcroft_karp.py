@@ -0,0 +1,177 @@
+from collections import deque
+
+def csr_from_edges(n_left, left, right):
+    """
+    Left-to-right adjacency in CSR form from edge arrays: the neighbors of left
+    vertex u are indices[indptr[u]:indptr[u + 1]]. Returns (indptr, indices).
+    """
+    import numpy as np
+
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    if left.shape != right.shape or left.ndim != 1:
+        raise ValueError("left and right must be one-dimensional arrays of equal length")
+    order = np.argsort(left, kind='stable')
+    indptr = np.zeros(n_left + 1, dtype=np.int64)
+    np.cumsum(np.bincount(left, minlength=n_left), out=indptr[1:])
+    return indptr, right[order]
+
+def hopcroft_karp_ids(n_left, n_right, indptr, indices):
+    """
+    Maximum bipartite matching in O(E sqrt(V)) on CSR adjacency over integer ids.
+
+    Every phase runs one BFS from all free left vertices that builds the layered
+    graph up to the first layer touching a free right vertex, then an iterative DFS
+    that finds a maximal set of vertex-disjoint shortest augmenting paths. A current
+    edge pointer per left vertex means each edge is scanned at most once per phase.
+
+    Returns (match_left, match_right) as lists, -1 for unmatched vertices.
+    """
+    # The loops index single elements, which is much faster on lists than on arrays
+    indptr = list(indptr.tolist() if hasattr(indptr, 'tolist') else indptr)
+    indices = list(indices.tolist() if hasattr(indices, 'tolist') else indices)
+    match_left = [-1] * n_left
+    match_right = [-1] * n_right
+
+    # Greedy start: usually settles most of the matching before the first phase
+    for u in range(n_left):
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if match_right[v] == -1:
+                match_left[u] = v
+                match_right[v] = u
+                break
+
+    infinity = n_left + 1
+    while True:
+        dist = [infinity] * n_left
+        queue = deque()
+        for u in range(n_left):
+            if match_left[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+
+        limit = infinity
+        while queue:
+            u = queue.popleft()
+            d = dist[u]
+            if d >= limit:
+                break
+            for k in range(indptr[u], indptr[u + 1]):
+                w = match_right[indices[k]]
+                if w == -1:
+                    limit = d
+                elif limit == infinity and dist[w] == infinity:
+                    # Layers beyond the first free column are never part of a
+                    # shortest augmenting path
+                    dist[w] = d + 1
+                    queue.append(w)
+        if limit == infinity:
+            break
+
+        pointer = indptr[:n_left]
+        for root in range(n_left):
+            if match_left[root] != -1 or dist[root] != 0:
+                continue
+            stack = [root]
+            cols = []
+            while stack:
+                u = stack[-1]
+                k, stop = pointer[u], indptr[u + 1]
+                layer = dist[u]
+                advanced = False
+                while k < stop:
+                    v = indices[k]
+                    k += 1
+                    w = match_right[v]
+                    if w == -1:
+                        if layer != limit:
+                            # Only the last layer may end a path, so every path
+                            # of the phase has the shortest length
+                            continue
+                        cols.append(v)
+                        for x, y in zip(stack, cols):
+                            match_left[x] = y
+                            match_right[y] = x
+                            # Vertices on a path are used once per phase
+                            dist[x] = infinity
+                        stack = []
+                        advanced = True
+                        break
+                    if layer < limit and dist[w] == layer + 1:
+                        stack.append(w)
+                        cols.append(v)
+                        advanced = True
+                        break
+                pointer[u] = k
+                if not advanced:
+                    # Dead end: no shortest augmenting path continues through u
+                    dist[u] = infinity
+                    stack.pop()
+                    if cols:
+                        cols.pop()
+
+    return match_left, match_right
+
+def hopcroft_karp(graph):
+    """
+    Maximum cardinality matching of a bipartite graph with the Hopcroft-Karp algorithm.
+
+    Parameters:
+    graph: Dictionary mapping each left vertex to a list of right vertices; left and
+           right vertices live in separate namespaces, so the same label may appear
+           on both sides
+
+    Returns:
+    A dictionary mapping each matched left vertex to its right vertex
+    """
+    left_labels = list(graph)
+    right_labels = []
+    right_index = {}
+    indptr = [0]
+    indices = []
+    for u in left_labels:
+        for w in graph[u]:
+            v = right_index.get(w)
+            if v is None:
+                v = right_index[w] = len(right_labels)
+                right_labels.append(w)
+            indices.append(v)
+        indptr.append(len(indices))
+
+    match_left, _ = hopcroft_karp_ids(len(left_labels), len(right_labels), indptr, indices)
+    return {left_labels[u]: right_labels[v] for u, v in enumerate(match_left) if v != -1}
+
+def hopcroft_karp_edges(left, right, n_left=None, n_right=None):
+    """
+    Hopcroft-Karp on edge arrays: edge i joins left vertex left[i] to right vertex right[i].
+
+    Returns (row_ind, col_ind) as int64 arrays in the convention of hungarian_algorithm:
+    row_ind[u] is the right vertex matched to u, col_ind[v] the left vertex matched to v,
+    -1 for unmatched vertices.
+    """
+    import numpy as np
+
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    if n_left is None:
+        n_left = int(left.max()) + 1 if len(left) else 0
+    if n_right is None:
+        n_right = int(right.max()) + 1 if len(right) else 0
+    indptr, indices = csr_from_edges(n_left, left, right)
+    match_left, match_right = hopcroft_karp_ids(n_left, n_right, indptr, indices)
+    return np.asarray(match_left, dtype=np.int64), np.asarray(match_right, dtype=np.int64)
+
+if __name__ == "__main__":
+
+    graph = {
+        'A1': ['B1', 'B2'],
+        'A2': ['B1'],
+        'A3': ['B2', 'B3'],
+        'A4': ['B3']
+    }
+
+    print("Matching:", hopcroft_karp(graph))
+
+    row_ind, col_ind = hopcroft_karp_edges([0, 0, 1, 2, 2, 3], [0, 1, 0, 1, 2, 2])
+    print("Edge arrays, row -> column:", row_ind.tolist())
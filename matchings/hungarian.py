@@ -111,6 +111,342 @@ def find_augmenting_path(cost_matrix, start_row, row_ind, col_ind, visited_cols)
     
     return False
 
+def augment_row(cost, row, u, v, col4row, row4col):
+    """
+    One shortest-augmenting-path phase (Jonker-Volgenant style) for a free row.
+
+    Parameters:
+    cost: n x m cost matrix with n <= m; np.inf marks a forbidden pair
+    row: The unassigned row to insert into the assignment
+    u, v: Row and column dual potentials, updated in place
+    col4row, row4col: Current assignment (-1 where free), updated in place
+
+    Returns:
+    The length of the shortest augmenting path in reduced costs; raises ValueError
+    if every path from the row is blocked by forbidden entries
+
+    Dijkstra runs over columns: each step scans the full reduced-cost row of the
+    last reached row as one vector operation, so a phase costs O(n * m) numpy work
+    and O(n) Python steps in the worst case.
+    """
+    m = cost.shape[1]
+    shortest = np.full(m, np.inf)
+    path = np.full(m, -1)
+    done = np.zeros(m, dtype=bool)
+    rows_seen = [row]
+
+    i = row
+    min_val = 0.0
+    while True:
+        reduced = min_val + cost[i] - u[i] - v
+        better = ~done & (reduced < shortest)
+        shortest[better] = reduced[better]
+        path[better] = i
+
+        open_shortest = np.where(done, np.inf, shortest)
+        j = int(np.argmin(open_shortest))
+        min_val = shortest[j]
+        if min_val == np.inf:
+            raise ValueError("Cost matrix is infeasible: some row cannot be assigned")
+        if row4col[j] != -1:
+            # Among equally short columns prefer a free one; with integer costs ties
+            # are common and this ends the phase early
+            free_ties = np.flatnonzero((open_shortest == min_val) & (row4col == -1))
+            if free_ties.size:
+                j = int(free_ties[0])
+        done[j] = True
+        if row4col[j] == -1:
+            sink = j
+            break
+        i = int(row4col[j])
+        rows_seen.append(i)
+
+    # Dual update keeps every assigned pair at zero reduced cost
+    u[row] += min_val
+    for r in rows_seen[1:]:
+        u[r] += min_val - shortest[col4row[r]]
+    v[done] -= min_val - shortest[done]
+
+    j = sink
+    while True:
+        i = path[j]
+        row4col[j] = i
+        col4row[i], j = j, col4row[i]
+        if i == row:
+            break
+    return min_val
+
+def _reduce_in_place(cost):
+    # Row reduction is valid whenever every row gets assigned (n <= m); column
+    # reduction only when every column does too, i.e. for square matrices
+    row_min = cost.min(axis=1, keepdims=True)
+    if np.isinf(row_min).any():
+        raise ValueError("Cost matrix is infeasible: some row cannot be assigned")
+    cost -= row_min
+    if cost.shape[0] == cost.shape[1]:
+        cost -= cost.min(axis=0)
+
+def hungarian_shortest_path(cost_matrix, in_place=False):
+    """
+    Solves the rectangular assignment problem with dual potentials and one
+    shortest augmenting path per row, O(n^2 * m) with the inner scans vectorized.
+
+    Parameters:
+    cost_matrix: n x m array-like of costs; np.inf marks a forbidden pair
+    in_place: If True, the array is used as given, without a float64 copy (float32 and
+              integer costs keep their dtype), and its row minima (and, for a square
+              matrix, column minima) are subtracted in place, so afterwards it holds
+              reduced costs. Peak extra memory is then O(n + m)
+
+    Returns:
+    (row_ind, col_ind) as in hungarian_algorithm: row_ind[i] is the column assigned
+    to row i and col_ind[j] the row assigned to column j, -1 where nothing is assigned
+    """
+    if in_place:
+        cost = np.asarray(cost_matrix)
+    else:
+        cost = np.asarray(cost_matrix, dtype=float)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+    if in_place and n:
+        _reduce_in_place(cost)
+
+    u = np.zeros(n)
+    v = np.zeros(m)
+    col4row = np.full(n, -1)
+    row4col = np.full(m, -1)
+    for row in range(n):
+        augment_row(cost, row, u, v, col4row, row4col)
+
+    if transposed:
+        return row4col, col4row
+    return col4row, row4col
+
+class _PaddedRows:
+    # Row access to an n x m cost matrix padded to m x m with zero-cost rows,
+    # without materializing the padding
+    def __init__(self, cost, m):
+        self.cost = cost
+        self.shape = (m, m)
+        self._zeros = np.zeros(m)
+
+    def __getitem__(self, i):
+        return self.cost[i] if i < len(self.cost) else self._zeros
+
+class AssignmentSolver:
+    """
+    Assignment that is re-optimized incrementally after cost changes.
+
+    The solver keeps the dual potentials and the current optimal assignment. An n x m
+    problem (n <= m) is treated as the square m x m problem padded with m - n implicit
+    zero-cost rows, which sit on the unassigned columns. Every change then breaks
+    optimality at exactly one row, which is repaired with a single shortest augmenting
+    path phase (augment_row), O(m^2) instead of a full O(n^2 * m) solve.
+
+    Parameters:
+    cost_matrix: n x m array-like of costs with n <= m; np.inf marks a forbidden pair
+    """
+
+    def __init__(self, cost_matrix):
+        cost = np.array(cost_matrix, dtype=float)
+        n, m = cost.shape
+        if n > m:
+            raise ValueError(f"AssignmentSolver needs at least as many columns as rows, got {n} x {m}")
+        self.cost = cost
+        self.u = np.zeros(m)
+        self.v = np.zeros(m)
+        self.col4row = np.full(m, -1)
+        self.row4col = np.full(m, -1)
+        for row in range(n):
+            augment_row(cost, row, self.u[:n], self.v, self.col4row[:n], self.row4col)
+
+        # Columns left free have v == 0 >= every other v, so the padding rows can
+        # take them with u == 0 and all reduced costs stay non-negative
+        free = np.flatnonzero(self.row4col == -1)
+        self.col4row[n:] = free
+        self.row4col[free] = np.arange(n, m)
+
+    @property
+    def shape(self):
+        return self.cost.shape
+
+    def _rows(self):
+        return _PaddedRows(self.cost, self.cost.shape[1])
+
+    def _release(self, row):
+        j = self.col4row[row]
+        self.col4row[row] = -1
+        self.row4col[j] = -1
+
+    def _reinsert(self, row):
+        # Restores dual feasibility on the row, then one augmenting-path phase
+        self.u[row] = np.min(self._rows()[row] - self.v)
+        augment_row(self._rows(), row, self.u, self.v, self.col4row, self.row4col)
+
+    def update_row(self, i, costs):
+        """
+        Replaces the costs of row i and re-optimizes with one augmenting-path phase.
+        """
+        self.cost[i] = costs
+        self._release(i)
+        self._reinsert(i)
+
+    def update_col(self, j, costs):
+        """
+        Replaces the costs of column j and re-optimizes with one augmenting-path phase
+        from the row that held it.
+        """
+        n = len(self.cost)
+        self.cost[:, j] = costs
+        row = self.row4col[j]
+        self._release(row)
+        column = np.zeros(len(self.v))
+        column[:n] = self.cost[:, j]
+        self.v[j] = np.min(column - self.u)
+        augment_row(self._rows(), row, self.u, self.v, self.col4row, self.row4col)
+
+    def add_row(self, costs):
+        """
+        Appends a row; one padding row becomes real and is re-inserted with one phase.
+        Returns the index of the new row.
+        """
+        n, m = self.cost.shape
+        if n == m:
+            raise ValueError("Cannot add a row: the problem already has as many rows as columns")
+        self.cost = np.vstack([self.cost, np.asarray(costs, dtype=float)[None, :]])
+        self._release(n)
+        self._reinsert(n)
+        return n
+
+    def remove_row(self, i):
+        """
+        Removes row i (later rows shift down by one); the freed column goes to a new
+        padding row, re-inserted with one phase.
+        """
+        n, m = self.cost.shape
+        self._release(i)
+        self.cost = np.delete(self.cost, i, axis=0)
+        self.u = np.append(np.delete(self.u, i), 0.0)
+        self.col4row = np.append(np.delete(self.col4row, i), -1)
+        self.row4col[self.row4col > i] -= 1
+        self._reinsert(m - 1)
+
+    def assignment(self):
+        """
+        Returns (row_ind, col_ind) in the convention of hungarian_algorithm, with -1 for
+        columns that no real row is assigned to.
+        """
+        n = len(self.cost)
+        col_ind = np.where(self.row4col < n, self.row4col, -1)
+        return self.col4row[:n].copy(), col_ind
+
+    def total_cost(self):
+        n = len(self.cost)
+        return self.cost[np.arange(n), self.col4row[:n]].sum()
+
+def _batch_shortest_path(costs):
+    # augment_row run on every problem of a (batch, n, m) stack at once, n <= m.
+    # Problems whose augmenting path is already complete drop out of `active`,
+    # so each step works only on the ones still searching
+    batch, n, m = costs.shape
+    everything = np.arange(batch)
+    u = np.zeros((batch, n))
+    v = np.zeros((batch, m))
+    col4row = np.full((batch, n), -1)
+    row4col = np.full((batch, m), -1)
+
+    for row in range(n):
+        shortest = np.full((batch, m), np.inf)
+        path = np.full((batch, m), -1)
+        done = np.zeros((batch, m), dtype=bool)
+        seen = np.zeros((batch, n), dtype=bool)
+        current = np.full(batch, row)
+        min_val = np.zeros(batch)
+        sink = np.full(batch, -1)
+
+        active = everything
+        while active.size:
+            i = current[active]
+            reduced = min_val[active, None] + costs[active, i] - u[active, i][:, None] - v[active]
+            closed = done[active]
+            best = shortest[active]
+            better = ~closed & (reduced < best)
+            best = np.where(better, reduced, best)
+            shortest[active] = best
+            path[active] = np.where(better, i[:, None], path[active])
+
+            open_best = np.where(closed, np.inf, best)
+            j = np.argmin(open_best, axis=1)
+            reached = best[np.arange(active.size), j]
+            if np.isinf(reached).any():
+                raise ValueError("Cost matrix is infeasible: some row cannot be assigned")
+            # Prefer a free column among the equally short ones, as in augment_row
+            free_ties = (open_best == reached[:, None]) & (row4col[active] == -1)
+            has_free = free_ties.any(axis=1)
+            j = np.where(has_free, np.argmax(free_ties, axis=1), j)
+            min_val[active] = reached
+            done[active, j] = True
+
+            owner = row4col[active, j]
+            free = owner == -1
+            sink[active[free]] = j[free]
+            active, owner = active[~free], owner[~free]
+            current[active] = owner
+            seen[active, owner] = True
+
+        u[:, row] += min_val
+        matched_shortest = np.take_along_axis(shortest, np.maximum(col4row, 0), axis=1)
+        u += np.where(seen, min_val[:, None] - matched_shortest, 0.0)
+        v -= np.where(done, min_val[:, None] - shortest, 0.0)
+
+        active, j = everything, sink
+        while active.size:
+            i = path[active, j]
+            row4col[active, j] = i
+            previous = col4row[active, i]
+            col4row[active, i] = j
+            unfinished = i != row
+            active, j = active[unfinished], previous[unfinished]
+
+    return col4row, row4col
+
+def _solve_batch(costs):
+    if costs.shape[1] > costs.shape[2]:
+        col4row, row4col = _batch_shortest_path(costs.transpose(0, 2, 1))
+        return row4col, col4row
+    return _batch_shortest_path(costs)
+
+def hungarian_batch(costs, workers=1):
+    """
+    Solves a stack of independent assignment problems of the same shape.
+
+    Parameters:
+    costs: (batch, n, m) array-like of costs; np.inf marks a forbidden pair
+    workers: Number of worker processes; 1 (default) solves the whole stack in-process,
+             more shards the batch axis across a ProcessPoolExecutor
+
+    Returns:
+    (row_ind, col_ind) stacked to shapes (batch, n) and (batch, m), with the same
+    per-problem meaning as hungarian_shortest_path
+
+    Every step of the shortest-augmenting-path phases is a vector operation across
+    the batch axis, so the Python overhead is paid per row rather than per matrix.
+    """
+    costs = np.asarray(costs, dtype=float)
+    if costs.ndim != 3:
+        raise ValueError(f"Expected a (batch, n, m) array, got shape {costs.shape}")
+    if workers <= 1 or len(costs) < 2:
+        return _solve_batch(costs)
+
+    from concurrent.futures import ProcessPoolExecutor
+    shards = np.array_split(costs, min(workers, len(costs)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_solve_batch, shards))
+    return (np.concatenate([r for r, _ in results]),
+            np.concatenate([c for _, c in results]))
+
 if __name__ == "__main__":
     cost_matrix = np.array([
         [7, 5, 9, 8],
@@ -128,3 +464,15 @@ if __name__ == "__main__":
         total_cost += cost_matrix[i, j]
     
     print(f"Total cost: {total_cost}")
+
+    row_indices, col_indices = hungarian_shortest_path(cost_matrix)
+    print("Shortest augmenting path solver:", row_indices.tolist(),
+          "total cost", cost_matrix[np.arange(len(row_indices)), row_indices].sum())
+
+    stack = np.stack([cost_matrix, cost_matrix[::-1], cost_matrix[:, ::-1]])
+    row_stack, _ = hungarian_batch(stack)
+    print("Batched solver:", row_stack.tolist())
+
+    solver = AssignmentSolver(cost_matrix)
+    solver.update_row(1, [1, 9, 9, 9])
+    print("After worker 1's costs change:", solver.assignment()[0].tolist(), "total cost", solver.total_cost())
@@ -1,3 +1,5 @@
+import heapq
+
 def kuhn_algorithm(preferences_a, preferences_b):
     rank_b = {b: {a: rank for rank, a in enumerate(prefs)} for b, prefs in preferences_b.items()}
     free_a = list(preferences_a.keys())
@@ -33,17 +35,296 @@ def kuhn_algorithm(preferences_a, preferences_b):
     
     return matches
 
-preferences_a = {
-    'A1': ['B1', 'B2', 'B3'],
-    'A2': ['B2', 'B1', 'B3'],
-    'A3': ['B1', 'B3', 'B2']
-}
+# Rank of a proposer its receiver does not list; never beats an empty slot
+UNACCEPTABLE = 2**31 - 1
+
+def _as_csr(preferences):
+    # Preference lists as (indptr, indices): either already a CSR pair, or an int
+    # matrix with one best-first row per agent where -1 pads truncated rows
+    import numpy as np
+
+    if isinstance(preferences, tuple):
+        indptr, indices = preferences
+        return np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int32)
+    matrix = np.asarray(preferences, dtype=np.int32)
+    if matrix.ndim != 2:
+        raise ValueError("Preferences must be a 2-D matrix or an (indptr, indices) pair")
+    listed = matrix >= 0
+    indptr = np.zeros(len(matrix) + 1, dtype=np.int64)
+    np.cumsum(listed.sum(axis=1), out=indptr[1:])
+    return indptr, matrix[listed]
+
+def proposal_ranks(preferences_a, preferences_b, n_a, n_b):
+    """
+    For every entry of the proposers' CSR lists, the rank the receiver gives that
+    proposer (UNACCEPTABLE if it does not list them), as an int32 array.
+
+    Complete receiver lists (an n_b x n_a matrix without padding) go through a dense
+    int32 rank matrix; truncated lists are matched up by sorting (receiver, proposer)
+    keys, so memory stays proportional to the number of listed pairs.
+    """
+    import numpy as np
+
+    a_indptr, a_indices = preferences_a
+    b_indptr, b_indices = preferences_b
+    proposer = np.repeat(np.arange(n_a, dtype=np.int64), np.diff(a_indptr))
+    receiver = np.repeat(np.arange(n_b, dtype=np.int64), np.diff(b_indptr))
+    position = np.arange(len(b_indices), dtype=np.int64) - b_indptr[receiver]
+
+    if len(b_indices) == n_a * n_b:
+        rank = np.full((n_b, n_a), -1, dtype=np.int32)
+        rank[receiver, b_indices] = position
+        # With n_a * n_b entries in total, a gap means some list repeats a proposer
+        incomplete = np.flatnonzero((rank < 0).any(axis=1))
+        if len(incomplete):
+            raise ValueError(f"Receiver {int(incomplete[0])} does not rank every proposer although "
+                             f"the receiver lists hold {n_b} x {n_a} entries; a list repeats a proposer")
+        return rank[a_indices, proposer]
+
+    keys = receiver * n_a + b_indices
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    wanted = a_indices.astype(np.int64) * n_a + proposer
+    # Sorted queries keep searchsorted walking the keys in order
+    query = np.argsort(wanted, kind='stable')
+    wanted = wanted[query]
+    found = np.minimum(np.searchsorted(keys, wanted), max(len(keys) - 1, 0))
+    ranks = np.full(len(a_indices), UNACCEPTABLE, dtype=np.int32)
+    if len(keys):
+        hit = keys[found] == wanted
+        ranks[query[hit]] = position[order[found[hit]]]
+    return ranks
+
+def gale_shapley_ids(preferences_a, preferences_b, n_b=None):
+    """
+    Proposer-optimal stable matching on integer-encoded agents.
+
+    Parameters:
+    preferences_a: Proposers' lists, best first: an n_a x k int matrix (-1 pads
+                   truncated rows) or an (indptr, indices) CSR pair
+    preferences_b: Receivers' lists over proposer ids, in the same formats
+    n_b: Number of receivers (defaults to the number of rows in preferences_b)
+
+    Returns:
+    int32 array mate with mate[a] = receiver matched to a, or -1
+
+    A pair is acceptable only if both sides list each other. Free proposers wait on
+    a deque; each one keeps a pointer to its next choice, so the inputs are never
+    modified and every list entry is proposed to at most once.
+    """
+    import numpy as np
+    from collections import deque
+
+    a_indptr, a_indices = _as_csr(preferences_a)
+    b_csr = _as_csr(preferences_b)
+    n_a = len(a_indptr) - 1
+    if n_b is None:
+        n_b = len(b_csr[0]) - 1
+    ranks = proposal_ranks((a_indptr, a_indices), b_csr, n_a, n_b)
+
+    # Plain lists make the scalar accesses of the proposal loop several times faster
+    targets = a_indices.tolist()
+    ranks = ranks.tolist()
+    pointer = a_indptr[:-1].tolist()
+    end = a_indptr[1:].tolist()
+    holder = [-1] * n_b
+    held_rank = [UNACCEPTABLE] * n_b
+
+    free = deque(range(n_a))
+    while free:
+        a = free.popleft()
+        k, stop = pointer[a], end[a]
+        while k < stop:
+            b, rank = targets[k], ranks[k]
+            k += 1
+            if rank < held_rank[b]:
+                previous = holder[b]
+                holder[b] = a
+                held_rank[b] = rank
+                if previous != -1:
+                    free.append(previous)
+                break
+        pointer[a] = k
+
+    mate = np.full(n_a, -1, dtype=np.int32)
+    holder = np.asarray(holder, dtype=np.int64)
+    matched = holder >= 0
+    mate[holder[matched]] = np.flatnonzero(matched)
+    return mate
+
+def stable_matching(preferences_a, preferences_b):
+    """
+    Same result as kuhn_algorithm, without consuming the caller's preference lists.
+    Agents are integer-encoded and solved by gale_shapley_ids.
+
+    Parameters:
+    preferences_a: Dictionary mapping each proposer to its list of receivers, best first
+    preferences_b: Dictionary mapping each receiver to its list of proposers, best first
+
+    Returns:
+    Dictionary mapping each matched proposer to its receiver
+    """
+    from itertools import chain
+
+    import numpy as np
+
+    labels_a = list(preferences_a)
+    index_a = {a: i for i, a in enumerate(labels_a)}
+    labels_b = list(preferences_b)
+    index_b = {b: i for i, b in enumerate(labels_b)}
+    for prefs in preferences_a.values():
+        for b in prefs:
+            if b not in index_b:
+                index_b[b] = len(labels_b)
+                labels_b.append(b)
+
+    def encode(preferences, labels, index):
+        lists = []
+        for label in labels:
+            prefs = preferences.get(label, ())
+            try:
+                lists.append(list(map(index.__getitem__, prefs)))
+            except KeyError:
+                # Agents nobody else knows about cannot be matched; drop them
+                lists.append([index[x] for x in prefs if x in index])
+        indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum([len(l) for l in lists], out=indptr[1:])
+        indices = np.fromiter(chain.from_iterable(lists), dtype=np.int32, count=int(indptr[-1]))
+        return indptr, indices
+
+    mate = gale_shapley_ids(encode(preferences_a, labels_a, index_b),
+                            encode(preferences_b, labels_b, index_a), len(labels_b))
+    return {labels_a[a]: labels_b[b] for a, b in enumerate(mate.tolist()) if b != -1}
+
+class CapacitatedStableMatching:
+    """
+    Proposer-optimal many-to-one stable matching (hospitals/residents) that is kept
+    current as proposers arrive.
+
+    Every receiver b admits up to capacities[b] proposers and keeps them in a max-heap
+    keyed by its rank of them, so the worst admitted proposer is found and evicted in
+    O(log q). Each proposer keeps a pointer to its next choice; deferred acceptance
+    does not depend on the order of proposals, so a new arrival only needs to run the
+    chain of proposals and evictions it triggers to give the same matching as a
+    solve from scratch. A pair is acceptable only if both sides list each other.
+
+    Parameters:
+    preferences_b: Dictionary mapping each receiver to its list of proposers, best first
+    capacities: Optional dictionary of receiver quotas; receivers not in it take one
+    preferences_a: Optional dictionary of initial proposers and their lists, best first
+
+    Attributes:
+    proposals: Number of proposals made so far
+    """
+
+    def __init__(self, preferences_b, capacities=None, preferences_a=None):
+        self.rank_b = {b: {a: rank for rank, a in enumerate(prefs)} for b, prefs in preferences_b.items()}
+        self.capacities = dict(capacities or {})
+        self.preferences_a = {}
+        self.matches = {}
+        self.proposals = 0
+        self._next = {}
+        # Max-heaps of (-rank, proposer) per receiver, via heapq on negated ranks
+        self._admitted = {b: [] for b in preferences_b}
+
+        for a, prefs in (preferences_a or {}).items():
+            self._enter(a, prefs)
+
+    def add_proposer(self, a, prefs, ranks_b=None):
+        """
+        Adds proposer a with its list of receivers, best first, and runs the proposals
+        it triggers. Returns the receiver a is matched to, or None.
+
+        ranks_b maps receivers to their rank of a, on the scale of the positions in
+        their preferences_b lists (lower is better): -1 puts a first, 1.5 between the
+        second and third listed proposers. It must not repeat a rank the receiver
+        already gives. Receivers that listed a at construction need no entry.
+        Raises ValueError if no receiver in prefs ranks a, since a could never be
+        matched.
+        """
+        if a in self.preferences_a:
+            raise ValueError(f"Proposer {a!r} is already in the market")
+        ranks_b = ranks_b or {}
+        rank_b = self.rank_b
+        for b in ranks_b:
+            if b not in rank_b:
+                raise ValueError(f"Receiver {b!r} is not in the market")
+        prefs = tuple(prefs)
+        if not any(b in ranks_b or a in rank_b.get(b, ()) for b in prefs):
+            raise ValueError(f"No receiver listed by proposer {a!r} ranks it")
+
+        for b, rank in ranks_b.items():
+            rank_b[b][a] = rank
+        self._enter(a, prefs)
+        return self.matches.get(a)
+
+    def _enter(self, a, prefs):
+        self.preferences_a[a] = tuple(prefs)
+        self._next[a] = 0
+        self._propose(a)
+
+    def _propose(self, a):
+        rank_b = self.rank_b
+        admitted = self._admitted
+        capacities = self.capacities
+        matches = self.matches
+
+        while a is not None:
+            prefs = self.preferences_a[a]
+            k = self._next[a]
+            evicted = None
+            while k < len(prefs):
+                b = prefs[k]
+                k += 1
+                rank = rank_b.get(b, {}).get(a)
+                if rank is None:
+                    continue
+                self.proposals += 1
+                heap = admitted[b]
+                if len(heap) < capacities.get(b, 1):
+                    heapq.heappush(heap, (-rank, a))
+                elif heap and -heap[0][0] > rank:
+                    evicted = heapq.heapreplace(heap, (-rank, a))[1]
+                    del matches[evicted]
+                else:
+                    continue
+                matches[a] = b
+                break
+            self._next[a] = k
+            a = evicted
+
+    def admitted(self, b):
+        """
+        Returns the proposers currently admitted by receiver b, best first.
+        """
+        return [a for _, a in sorted(self._admitted.get(b, ()), reverse=True)]
+
+    def matching(self):
+        """
+        Returns the matching as a dictionary mapping each matched proposer to its receiver.
+        """
+        return dict(self.matches)
+
+if __name__ == "__main__":
+    preferences_a = {
+        'A1': ['B1', 'B2', 'B3'],
+        'A2': ['B2', 'B1', 'B3'],
+        'A3': ['B1', 'B3', 'B2']
+    }
+
+    preferences_b = {
+        'B1': ['A1', 'A2', 'A3'],
+        'B2': ['A2', 'A1', 'A3'],
+        'B3': ['A1', 'A3', 'A2']
+    }
+
+    print("Array engine:", stable_matching(preferences_a, preferences_b))
 
-preferences_b = {
-    'B1': ['A1', 'A2', 'A3'],
-    'B2': ['A2', 'A1', 'A3'],
-    'B3': ['A1', 'A3', 'A2']
-}
+    market = CapacitatedStableMatching(preferences_b, capacities={'B1': 2}, preferences_a=preferences_a)
+    print("With B1 admitting two:", market.matching())
+    # A new proposer brings the receivers' ranks of it: B1 puts A4 first, B3 last
+    market.add_proposer('A4', ['B1', 'B3'], ranks_b={'B1': -1, 'B3': 3})
+    print("After A4 arrives:", market.matching(), "B1 admits", market.admitted('B1'))
 
-matches = kuhn_algorithm(preferences_a, preferences_b)
-print("Final matches:", matches)
+    matches = kuhn_algorithm(preferences_a, preferences_b)
+    print("Final matches:", matches)
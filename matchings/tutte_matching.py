@@ -1,8 +1,9 @@
 import random
-import numpy as np
 import warnings
 
 def build_randomized_tutte_matrix(n, edges, random_range=(1, 10**9)):
+    import numpy as np
+
     matrix = np.zeros((n, n), dtype=np.float64)
     variables = {} 
 
@@ -23,7 +24,114 @@ def build_randomized_tutte_matrix(n, edges, random_range=(1, 10**9)):
 
     return matrix
 
-def get_maximum_matching_size_randomized(n, edges, random_range=(1, 10**9)):
+# Largest prime below 2^31: residues and their inverses fit int32, products fit int64
+TUTTE_PRIME = 2**31 - 1
+
+# Pivot columns per elimination panel; keeps the float64 trailing update exact (see _sub_product_mod_p)
+_PANEL = 64
+
+def build_tutte_matrix_mod_p(n, edges, p=TUTTE_PRIME):
+    """
+    Tutte matrix over GF(p): for every edge, a uniform value x in 1 .. p-1 at (i, j) and
+    -x = p - x at (j, i). Returns an int64 array with entries in 0 .. p-1.
+    """
+    import numpy as np
+
+    matrix = np.zeros((n, n), dtype=np.int64)
+    variables = {}
+
+    for u, v in edges:
+        if not (0 <= u < n and 0 <= v < n):
+            raise ValueError(f"Vertices ({u}, {v}) out of bounds for n={n}")
+        if u == v:
+            raise ValueError(f"Self-loops ({u}, {v}) are not supported in this context.")
+
+        i, j = min(u, v), max(u, v)
+
+        if (i, j) not in variables:
+            variables[(i, j)] = random.randint(1, p - 1)
+
+        matrix[i, j] = variables[(i, j)]
+        matrix[j, i] = p - variables[(i, j)]
+
+    return matrix
+
+def _sub_product_mod_p(c, a, b, p):
+    # (c - a @ b) mod p for residues below 2^31 and at most _PANEL inner terms. b is
+    # split into 16-bit halves, so every float64 product sum stays below 2^53 and BLAS
+    # computes it exactly
+    import numpy as np
+
+    a = a.astype(np.float64)
+    result = (a @ (b >> 16).astype(np.float64)).astype(np.int64)
+    result %= p
+    result <<= 16
+    # Below 2^47 + 2^53, so the sum and the difference with c fit int64
+    result += (a @ (b & 0xFFFF).astype(np.float64)).astype(np.int64)
+    np.subtract(c, result, out=result)
+    result %= p
+    return result
+
+def rank_mod_p(matrix, p=TUTTE_PRIME):
+    """
+    Exact rank of an integer matrix over GF(p), p a prime below 2^31.
+
+    Blocked Gaussian elimination: each panel of _PANEL columns is eliminated row-wise
+    with vectorized int64 operations, recording the multipliers; the rest of the matrix
+    then gets the whole panel at once as a Schur complement update, computed exactly
+    with float64 matrix products. Rows that became pivots leave the working matrix, so
+    it shrinks with every panel.
+    """
+    import numpy as np
+
+    work = np.asarray(matrix, dtype=np.int64) % p
+    rank = 0
+    while work.shape[0] and work.shape[1]:
+        rows = work.shape[0]
+        width = min(_PANEL, work.shape[1])
+        panel = work[:, :width].copy()
+        multipliers = np.zeros((rows, width), dtype=np.int64)
+        alive = np.ones(rows, dtype=bool)
+        pivots = []
+        inverses = []
+
+        for j in range(width):
+            candidates = np.flatnonzero((panel[:, j] != 0) & alive)
+            if not len(candidates):
+                continue
+            q = candidates[0]
+            alive[q] = False
+            inverse = pow(int(panel[q, j]), p - 2, p)
+            t = len(pivots)
+            pivots.append(q)
+            inverses.append(inverse)
+
+            # Every remaining row subtracts factor times the normalized pivot row
+            factor = np.where(alive, panel[:, j], 0)
+            multipliers[:, t] = factor
+            targets = np.flatnonzero(factor)
+            if len(targets) and j + 1 < width:
+                pivot_row = panel[q, j + 1:] * inverse % p
+                panel[targets, j + 1:] = (panel[targets, j + 1:]
+                                          - factor[targets, None] * pivot_row) % p
+
+        r = len(pivots)
+        trailing = work[:, width:]
+        if r and trailing.shape[1]:
+            # Trailing part of each pivot row after the earlier pivots of the panel
+            upper = np.empty((r, trailing.shape[1]), dtype=np.int64)
+            for t, q in enumerate(pivots):
+                row = trailing[q]
+                if t:
+                    row = row - ((multipliers[q, :t, None] * upper[:t]) % p).sum(axis=0)
+                upper[t] = row % p * inverses[t] % p
+            work = _sub_product_mod_p(trailing[alive], multipliers[alive, :r], upper, p)
+        else:
+            work = trailing[alive]
+        rank += r
+    return rank
+
+def get_maximum_matching_size_randomized(n, edges, random_range=(1, 10**9), exact=False):
     if n == 0:
         return 0
     if not edges and n > 0:
@@ -31,12 +139,25 @@ def get_maximum_matching_size_randomized(n, edges, random_range=(1, 10**9)):
     if n > 0 and not edges:
         return 0
 
+    if exact:
+        # Values are drawn from GF(TUTTE_PRIME) instead of random_range; the rank is
+        # exact and always even, and falls short of twice the maximum matching size
+        # with probability at most n / TUTTE_PRIME
+        try:
+            tutte_matrix = build_tutte_matrix_mod_p(n, edges)
+        except ValueError as e:
+            print(f"Error building Tutte matrix: {e}")
+            return -1
+        return rank_mod_p(tutte_matrix) // 2
+
     try:
         tutte_matrix = build_randomized_tutte_matrix(n, edges, random_range)
     except ValueError as e:
         print(f"Error building Tutte matrix: {e}")
         return -1 
 
+    import numpy as np
+
     rank = np.linalg.matrix_rank(tutte_matrix)
 
     if rank % 2 != 0:
@@ -47,13 +168,13 @@ def get_maximum_matching_size_randomized(n, edges, random_range=(1, 10**9)):
 
     return max_matching_size
 
-def has_perfect_matching_randomized(n, edges, random_range=(1, 10**9)):
+def has_perfect_matching_randomized(n, edges, random_range=(1, 10**9), exact=False):
     if n % 2 != 0:
         return False
     if n == 0:
         return True
 
-    max_matching_size = get_maximum_matching_size_randomized(n, edges, random_range)
+    max_matching_size = get_maximum_matching_size_randomized(n, edges, random_range, exact)
 
     if max_matching_size < 0:
         print("Could not determine perfect matching due to error in size calculation.")
@@ -61,85 +182,92 @@ def has_perfect_matching_randomized(n, edges, random_range=(1, 10**9)):
 
     return max_matching_size == n // 2
 
+if __name__ == "__main__":
+    print("--- Randomized Tutte Matrix Algorithms ---")
+
+    n1 = 4
+    edges1 = [(0, 1), (1, 2), (2, 3), (3, 0)]
+    print(f"\nGraph 1: Square (n={n1}, edges={edges1})")
+    size1 = get_maximum_matching_size_randomized(n1, edges1)
+    pm1 = has_perfect_matching_randomized(n1, edges1)
+    print(f"  Est. Max Matching Size: {size1} (Expected: 2)")
+    print(f"  Likely has Perfect Matching? {pm1} (Expected: True)")
+    if pm1 is not None:
+        print(f"  Consistency Check: {pm1 == (size1 == n1 // 2)}")
+
+    n2 = 3
+    edges2 = [(0, 1), (1, 2)]
+    print(f"\nGraph 2: Path P3 (n={n2}, edges={edges2})")
+    size2 = get_maximum_matching_size_randomized(n2, edges2)
+    pm2 = has_perfect_matching_randomized(n2, edges2)
+    print(f"  Est. Max Matching Size: {size2} (Expected: 1)")
+    print(f"  Likely has Perfect Matching? {pm2} (Expected: False)")
+
+    n3 = 4
+    edges3 = [(0, 1), (1, 2), (2, 3)]
+    print(f"\nGraph 3: Path P4 (n={n3}, edges={edges3})")
+    size3 = get_maximum_matching_size_randomized(n3, edges3)
+    pm3 = has_perfect_matching_randomized(n3, edges3)
+    print(f"  Est. Max Matching Size: {size3} (Expected: 2)")
+    print(f"  Likely has Perfect Matching? {pm3} (Expected: True)")
+    if pm3 is not None:
+        print(f"  Consistency Check: {pm3 == (size3 == n3 // 2)}")
+
+    n4 = 4
+    edges4 = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    print(f"\nGraph 4: Complete K4 (n={n4}, edges={edges4})")
+    size4 = get_maximum_matching_size_randomized(n4, edges4)
+    pm4 = has_perfect_matching_randomized(n4, edges4)
+    print(f"  Est. Max Matching Size: {size4} (Expected: 2)")
+    print(f"  Likely has Perfect Matching? {pm4} (Expected: True)")
+    if pm4 is not None:
+        print(f"  Consistency Check: {pm4 == (size4 == n4 // 2)}")
+
+    n5 = 4
+    edges5 = [(0, 1), (0, 2), (0, 3)]
+    print(f"\nGraph 5: Claw K1,3 (n={n5}, edges={edges5})")
+    size5 = get_maximum_matching_size_randomized(n5, edges5)
+    pm5 = has_perfect_matching_randomized(n5, edges5)
+    print(f"  Est. Max Matching Size: {size5} (Expected: 1)")
+    print(f"  Likely has Perfect Matching? {pm5} (Expected: False)")
+    if pm5 is not None:
+        print(f"  Consistency Check: {pm5 == (size5 == n5 // 2)}")
+
+    n6 = 10
+    edges6 = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0),
+              (5, 7), (7, 9), (9, 6), (6, 8), (8, 5),
+              (0, 5), (1, 6), (2, 7), (3, 8), (4, 9)] 
+    print(f"\nGraph 6: Petersen Graph (n={n6})")
+    size6 = get_maximum_matching_size_randomized(n6, edges6)
+    pm6 = has_perfect_matching_randomized(n6, edges6)
+    print(f"  Est. Max Matching Size: {size6} (Expected: 5)")
+    print(f"  Likely has Perfect Matching? {pm6} (Expected: True)")
+    if pm6 is not None:
+        print(f"  Consistency Check: {pm6 == (size6 == n6 // 2)}")
+
+    n7 = 4
+    edges7 = []
+    print(f"\nGraph 7: Empty Graph (n={n7})")
+    size7 = get_maximum_matching_size_randomized(n7, edges7)
+    pm7 = has_perfect_matching_randomized(n7, edges7)
+    print(f"  Est. Max Matching Size: {size7} (Expected: 0)")
+    print(f"  Likely has Perfect Matching? {pm7} (Expected: False)") 
+    if pm7 is not None:
+         print(f"  Consistency Check: {pm7 == (size7 == n7 // 2)}")
+
+    n8 = 4
+    edges8 = [(0,1)] 
+    print(f"\nGraph 8: Isolated Vertices (n={n8}, edges={edges8})")
+    size8 = get_maximum_matching_size_randomized(n8, edges8)
+    pm8 = has_perfect_matching_randomized(n8, edges8)
+    print(f"  Est. Max Matching Size: {size8} (Expected: 1)")
+    print(f"  Likely has Perfect Matching? {pm8} (Expected: False)")
+    if pm8 is not None:
+         print(f"  Consistency Check: {pm8 == (size8 == n8 // 2)}")
 
-print("--- Randomized Tutte Matrix Algorithms ---")
-
-n1 = 4
-edges1 = [(0, 1), (1, 2), (2, 3), (3, 0)]
-print(f"\nGraph 1: Square (n={n1}, edges={edges1})")
-size1 = get_maximum_matching_size_randomized(n1, edges1)
-pm1 = has_perfect_matching_randomized(n1, edges1)
-print(f"  Est. Max Matching Size: {size1} (Expected: 2)")
-print(f"  Likely has Perfect Matching? {pm1} (Expected: True)")
-if pm1 is not None:
-    print(f"  Consistency Check: {pm1 == (size1 == n1 // 2)}")
-
-n2 = 3
-edges2 = [(0, 1), (1, 2)]
-print(f"\nGraph 2: Path P3 (n={n2}, edges={edges2})")
-size2 = get_maximum_matching_size_randomized(n2, edges2)
-pm2 = has_perfect_matching_randomized(n2, edges2)
-print(f"  Est. Max Matching Size: {size2} (Expected: 1)")
-print(f"  Likely has Perfect Matching? {pm2} (Expected: False)")
-
-n3 = 4
-edges3 = [(0, 1), (1, 2), (2, 3)]
-print(f"\nGraph 3: Path P4 (n={n3}, edges={edges3})")
-size3 = get_maximum_matching_size_randomized(n3, edges3)
-pm3 = has_perfect_matching_randomized(n3, edges3)
-print(f"  Est. Max Matching Size: {size3} (Expected: 2)")
-print(f"  Likely has Perfect Matching? {pm3} (Expected: True)")
-if pm3 is not None:
-    print(f"  Consistency Check: {pm3 == (size3 == n3 // 2)}")
-
-n4 = 4
-edges4 = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
-print(f"\nGraph 4: Complete K4 (n={n4}, edges={edges4})")
-size4 = get_maximum_matching_size_randomized(n4, edges4)
-pm4 = has_perfect_matching_randomized(n4, edges4)
-print(f"  Est. Max Matching Size: {size4} (Expected: 2)")
-print(f"  Likely has Perfect Matching? {pm4} (Expected: True)")
-if pm4 is not None:
-    print(f"  Consistency Check: {pm4 == (size4 == n4 // 2)}")
-
-n5 = 4
-edges5 = [(0, 1), (0, 2), (0, 3)]
-print(f"\nGraph 5: Claw K1,3 (n={n5}, edges={edges5})")
-size5 = get_maximum_matching_size_randomized(n5, edges5)
-pm5 = has_perfect_matching_randomized(n5, edges5)
-print(f"  Est. Max Matching Size: {size5} (Expected: 1)")
-print(f"  Likely has Perfect Matching? {pm5} (Expected: False)")
-if pm5 is not None:
-    print(f"  Consistency Check: {pm5 == (size5 == n5 // 2)}")
-
-n6 = 10
-edges6 = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0),
-          (5, 7), (7, 9), (9, 6), (6, 8), (8, 5),
-          (0, 5), (1, 6), (2, 7), (3, 8), (4, 9)] 
-print(f"\nGraph 6: Petersen Graph (n={n6})")
-size6 = get_maximum_matching_size_randomized(n6, edges6)
-pm6 = has_perfect_matching_randomized(n6, edges6)
-print(f"  Est. Max Matching Size: {size6} (Expected: 5)")
-print(f"  Likely has Perfect Matching? {pm6} (Expected: True)")
-if pm6 is not None:
-    print(f"  Consistency Check: {pm6 == (size6 == n6 // 2)}")
-
-n7 = 4
-edges7 = []
-print(f"\nGraph 7: Empty Graph (n={n7})")
-size7 = get_maximum_matching_size_randomized(n7, edges7)
-pm7 = has_perfect_matching_randomized(n7, edges7)
-print(f"  Est. Max Matching Size: {size7} (Expected: 0)")
-print(f"  Likely has Perfect Matching? {pm7} (Expected: False)") 
-if pm7 is not None:
-     print(f"  Consistency Check: {pm7 == (size7 == n7 // 2)}")
-
-n8 = 4
-edges8 = [(0,1)] 
-print(f"\nGraph 8: Isolated Vertices (n={n8}, edges={edges8})")
-size8 = get_maximum_matching_size_randomized(n8, edges8)
-pm8 = has_perfect_matching_randomized(n8, edges8)
-print(f"  Est. Max Matching Size: {size8} (Expected: 1)")
-print(f"  Likely has Perfect Matching? {pm8} (Expected: False)")
-if pm8 is not None:
-     print(f"  Consistency Check: {pm8 == (size8 == n8 // 2)}")
+    print("\n--- Exact mode (rank over GF(TUTTE_PRIME)) ---")
+    graphs = [(n1, edges1, 2), (n2, edges2, 1), (n3, edges3, 2), (n4, edges4, 2),
+              (n5, edges5, 1), (n6, edges6, 5), (n7, edges7, 0), (n8, edges8, 1)]
+    for number, (n, edges, expected) in enumerate(graphs, 1):
+        size = get_maximum_matching_size_randomized(n, edges, exact=True)
+        print(f"  Graph {number}: Max Matching Size {size} (Expected: {expected})")
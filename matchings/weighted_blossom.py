@@ -0,0 +1,452 @@
+from numbers import Integral
+
+from .edmonds_blossom import relabel_graph
+
+def max_weight_matching_ids(n, edges, max_cardinality=False):
+    """
+    Primal-dual weighted blossom algorithm (Edmonds, in Galil's O(V^3) formulation).
+
+    Parameters:
+    n: Number of vertices, numbered 0 .. n-1
+    edges: List of (u, v, weight) triples with u != v
+    max_cardinality: If True, only maximum-cardinality matchings are considered and
+                     the heaviest of them is returned
+
+    Returns:
+    A list mate where mate[v] is the vertex matched to v, or -1 if v is unmatched
+
+    Vertices 0 .. n-1 are trivial blossoms, ids n .. 2n-1 are reused for non-trivial
+    ones. Edge k has endpoints 2k (its first vertex) and 2k+1 (its second vertex);
+    mate and labelend store endpoints, so p ^ 1 is the opposite end of the same edge.
+    Integer weights are handled exactly; float weights are subject to rounding.
+    """
+    if not edges:
+        return [-1] * n
+
+    edge_count = len(edges)
+    max_weight = max(0, max(w for _, _, w in edges))
+    endpoint = [edges[p // 2][p % 2] for p in range(2 * edge_count)]
+    neighbend = [[] for _ in range(n)]
+    for k, (i, j, _) in enumerate(edges):
+        neighbend[i].append(2 * k + 1)
+        neighbend[j].append(2 * k)
+
+    mate = [-1] * n
+    # label: 0 free, 1 S (outer), 2 T (inner); 5 marks a blossom during scan_blossom
+    label = [0] * (2 * n)
+    labelend = [-1] * (2 * n)
+    inblossom = list(range(n))
+    blossomparent = [-1] * (2 * n)
+    blossomchilds = [None] * (2 * n)
+    blossombase = list(range(n)) + [-1] * n
+    blossomendps = [None] * (2 * n)
+    bestedge = [-1] * (2 * n)
+    blossombestedges = [None] * (2 * n)
+    unusedblossoms = list(range(n, 2 * n))
+    dualvar = [max_weight] * n + [0] * n
+    allowedge = [False] * edge_count
+    queue = []
+
+    def slack(k):
+        i, j, w = edges[k]
+        return dualvar[i] + dualvar[j] - 2 * w
+
+    def blossom_leaves(b):
+        if b < n:
+            return [b]
+        leaves = []
+        stack = [b]
+        while stack:
+            t = stack.pop()
+            if t < n:
+                leaves.append(t)
+            else:
+                stack.extend(blossomchilds[t])
+        return leaves
+
+    def assign_label(w, t, p):
+        # Labels w's top-level blossom; a T blossom immediately labels its mate S
+        while True:
+            b = inblossom[w]
+            label[w] = label[b] = t
+            labelend[w] = labelend[b] = p
+            bestedge[w] = bestedge[b] = -1
+            if t == 1:
+                queue.extend(blossom_leaves(b))
+                return
+            base = blossombase[b]
+            w, t, p = endpoint[mate[base]], 1, mate[base] ^ 1
+
+    def scan_blossom(v, w):
+        # Traces back from v and w to find a new blossom's base, or -1 if the
+        # two paths end in different roots (an augmenting path)
+        path = []
+        base = -1
+        while v != -1 or w != -1:
+            b = inblossom[v]
+            if label[b] & 4:
+                base = blossombase[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if labelend[b] == -1:
+                v = -1
+            else:
+                v = endpoint[labelend[b]]
+                b = inblossom[v]
+                v = endpoint[labelend[b]]
+            if w != -1:
+                v, w = w, v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def add_blossom(base, k):
+        v, w, _ = edges[k]
+        bb = inblossom[base]
+        bv = inblossom[v]
+        bw = inblossom[w]
+        b = unusedblossoms.pop()
+        blossombase[b] = base
+        blossomparent[b] = -1
+        blossomparent[bb] = b
+        blossomchilds[b] = path = []
+        blossomendps[b] = endps = []
+
+        while bv != bb:
+            blossomparent[bv] = b
+            path.append(bv)
+            endps.append(labelend[bv])
+            v = endpoint[labelend[bv]]
+            bv = inblossom[v]
+        path.append(bb)
+        path.reverse()
+        endps.reverse()
+        endps.append(2 * k)
+        while bw != bb:
+            blossomparent[bw] = b
+            path.append(bw)
+            endps.append(labelend[bw] ^ 1)
+            w = endpoint[labelend[bw]]
+            bw = inblossom[w]
+
+        label[b] = 1
+        labelend[b] = labelend[bb]
+        dualvar[b] = 0
+        for v in blossom_leaves(b):
+            if label[inblossom[v]] == 2:
+                queue.append(v)
+            inblossom[v] = b
+
+        # Least-slack edges from the new blossom to each neighbouring S blossom
+        bestedgeto = {}
+        for bv in path:
+            if blossombestedges[bv] is None:
+                nblists = [[p // 2 for p in neighbend[v]] for v in blossom_leaves(bv)]
+            else:
+                nblists = [blossombestedges[bv]]
+            for nblist in nblists:
+                for k in nblist:
+                    i, j, _ = edges[k]
+                    if inblossom[j] == b:
+                        i, j = j, i
+                    bj = inblossom[j]
+                    if bj != b and label[bj] == 1 and (
+                            bj not in bestedgeto or slack(k) < slack(bestedgeto[bj])):
+                        bestedgeto[bj] = k
+            blossombestedges[bv] = None
+            bestedge[bv] = -1
+        blossombestedges[b] = list(bestedgeto.values())
+        bestedge[b] = -1
+        for k in blossombestedges[b]:
+            if bestedge[b] == -1 or slack(k) < slack(bestedge[b]):
+                bestedge[b] = k
+
+    def expand_blossom(b, endstage):
+        # At the end of a stage, sub-blossoms with zero dual are expanded as well;
+        # they go on an explicit stack instead of a recursive call. Only the blossom
+        # expanded during a stage (endstage False) needs its labels rebuilt
+        stack = [b]
+        while stack:
+            b = stack.pop()
+            for s in blossomchilds[b]:
+                blossomparent[s] = -1
+                if s < n:
+                    inblossom[s] = s
+                elif endstage and dualvar[s] == 0:
+                    stack.append(s)
+                else:
+                    for v in blossom_leaves(s):
+                        inblossom[v] = s
+
+            if not endstage and label[b] == 2:
+                # Relabel the sub-blossoms on the even-length path from the entry
+                # child to the base; the rest become free or keep their T labels
+                entrychild = inblossom[endpoint[labelend[b] ^ 1]]
+                j = blossomchilds[b].index(entrychild)
+                if j & 1:
+                    j -= len(blossomchilds[b])
+                    jstep = 1
+                    endptrick = 0
+                else:
+                    jstep = -1
+                    endptrick = 1
+                p = labelend[b]
+                while j != 0:
+                    label[endpoint[p ^ 1]] = 0
+                    label[endpoint[blossomendps[b][j - endptrick] ^ endptrick ^ 1]] = 0
+                    assign_label(endpoint[p ^ 1], 2, p)
+                    allowedge[blossomendps[b][j - endptrick] // 2] = True
+                    j += jstep
+                    p = blossomendps[b][j - endptrick] ^ endptrick
+                    allowedge[p // 2] = True
+                    j += jstep
+                bv = blossomchilds[b][j]
+                label[endpoint[p ^ 1]] = label[bv] = 2
+                labelend[endpoint[p ^ 1]] = labelend[bv] = p
+                bestedge[bv] = -1
+                j += jstep
+                while blossomchilds[b][j] != entrychild:
+                    bv = blossomchilds[b][j]
+                    if label[bv] == 1:
+                        j += jstep
+                        continue
+                    reached = -1
+                    for v in blossom_leaves(bv):
+                        if label[v] != 0:
+                            reached = v
+                            break
+                    if reached != -1:
+                        label[reached] = 0
+                        label[endpoint[mate[blossombase[bv]]]] = 0
+                        assign_label(reached, 2, labelend[reached])
+                    j += jstep
+
+            label[b] = labelend[b] = -1
+            blossomchilds[b] = blossomendps[b] = None
+            blossombase[b] = -1
+            blossombestedges[b] = None
+            bestedge[b] = -1
+            unusedblossoms.append(b)
+
+    def augment_blossom(b, v):
+        # Swaps matched and unmatched edges on the path inside b from v to the
+        # base, then rotates the child list so that v's sub-blossom is the base.
+        # Nested sub-blossoms on the path are handled through an explicit stack.
+        # Each blossom only swaps its own edges between children, so the order of
+        # the swaps does not matter; a blossom's rotation reads the new base of its
+        # first child, so rotations run children first (reverse discovery order)
+        stack = [(b, v)]
+        rotations = []
+        while stack:
+            b, v = stack.pop()
+            t = v
+            while blossomparent[t] != b:
+                t = blossomparent[t]
+            if t >= n:
+                stack.append((t, v))
+            i = j = blossomchilds[b].index(t)
+            if i & 1:
+                j -= len(blossomchilds[b])
+                jstep = 1
+                endptrick = 0
+            else:
+                jstep = -1
+                endptrick = 1
+            while j != 0:
+                j += jstep
+                t = blossomchilds[b][j]
+                p = blossomendps[b][j - endptrick] ^ endptrick
+                if t >= n:
+                    stack.append((t, endpoint[p]))
+                j += jstep
+                t = blossomchilds[b][j]
+                if t >= n:
+                    stack.append((t, endpoint[p ^ 1]))
+                mate[endpoint[p]] = p ^ 1
+                mate[endpoint[p ^ 1]] = p
+            rotations.append((b, i))
+
+        for b, i in reversed(rotations):
+            blossomchilds[b] = blossomchilds[b][i:] + blossomchilds[b][:i]
+            blossomendps[b] = blossomendps[b][i:] + blossomendps[b][:i]
+            blossombase[b] = blossombase[blossomchilds[b][0]]
+
+    def augment_matching(k):
+        v, w, _ = edges[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = inblossom[s]
+                if bs >= n:
+                    augment_blossom(bs, s)
+                mate[s] = p
+                if labelend[bs] == -1:
+                    break
+                t = endpoint[labelend[bs]]
+                bt = inblossom[t]
+                s = endpoint[labelend[bt]]
+                j = endpoint[labelend[bt] ^ 1]
+                if bt >= n:
+                    augment_blossom(bt, j)
+                mate[j] = labelend[bt]
+                p = labelend[bt] ^ 1
+
+    for _ in range(n):
+        # One stage: grow alternating trees from every free vertex until an
+        # augmenting path is found or the duals prove optimality
+        label[:] = [0] * (2 * n)
+        bestedge[:] = [-1] * (2 * n)
+        blossombestedges[n:] = [None] * n
+        allowedge[:] = [False] * edge_count
+        queue[:] = []
+
+        for v in range(n):
+            if mate[v] == -1 and label[inblossom[v]] == 0:
+                assign_label(v, 1, -1)
+
+        augmented = False
+        while True:
+            while queue and not augmented:
+                v = queue.pop()
+                for p in neighbend[v]:
+                    k = p // 2
+                    w = endpoint[p]
+                    if inblossom[v] == inblossom[w]:
+                        continue
+                    if not allowedge[k]:
+                        kslack = slack(k)
+                        if kslack <= 0:
+                            allowedge[k] = True
+                    if allowedge[k]:
+                        if label[inblossom[w]] == 0:
+                            assign_label(w, 2, p ^ 1)
+                        elif label[inblossom[w]] == 1:
+                            base = scan_blossom(v, w)
+                            if base >= 0:
+                                add_blossom(base, k)
+                            else:
+                                augment_matching(k)
+                                augmented = True
+                                break
+                        elif label[w] == 0:
+                            label[w] = 2
+                            labelend[w] = p ^ 1
+                    elif label[inblossom[w]] == 1:
+                        b = inblossom[v]
+                        if bestedge[b] == -1 or kslack < slack(bestedge[b]):
+                            bestedge[b] = k
+                    elif label[w] == 0:
+                        if bestedge[w] == -1 or kslack < slack(bestedge[w]):
+                            bestedge[w] = k
+
+            if augmented:
+                break
+
+            # Dual adjustment: the smallest of the four delta types
+            delta_type = -1
+            delta = delta_edge = delta_blossom = None
+            if not max_cardinality:
+                delta_type = 1
+                delta = min(dualvar[:n])
+
+            for v in range(n):
+                if label[inblossom[v]] == 0 and bestedge[v] != -1:
+                    d = slack(bestedge[v])
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 2
+                        delta_edge = bestedge[v]
+
+            for b in range(2 * n):
+                if blossomparent[b] == -1 and label[b] == 1 and bestedge[b] != -1:
+                    kslack = slack(bestedge[b])
+                    d = kslack // 2 if isinstance(kslack, Integral) else kslack / 2
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 3
+                        delta_edge = bestedge[b]
+
+            for b in range(n, 2 * n):
+                if (blossombase[b] >= 0 and blossomparent[b] == -1 and label[b] == 2
+                        and (delta_type == -1 or dualvar[b] < delta)):
+                    delta = dualvar[b]
+                    delta_type = 4
+                    delta_blossom = b
+
+            if delta_type == -1:
+                # Only reachable with max_cardinality: no further progress possible
+                delta_type = 1
+                delta = max(0, min(dualvar[:n]))
+
+            for v in range(n):
+                if label[inblossom[v]] == 1:
+                    dualvar[v] -= delta
+                elif label[inblossom[v]] == 2:
+                    dualvar[v] += delta
+            for b in range(n, 2 * n):
+                if blossombase[b] >= 0 and blossomparent[b] == -1:
+                    if label[b] == 1:
+                        dualvar[b] += delta
+                    elif label[b] == 2:
+                        dualvar[b] -= delta
+
+            if delta_type == 1:
+                break
+            elif delta_type == 2:
+                allowedge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                if label[inblossom[i]] == 0:
+                    i, j = j, i
+                queue.append(i)
+            elif delta_type == 3:
+                allowedge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                queue.append(i)
+            else:
+                expand_blossom(delta_blossom, False)
+
+        if not augmented:
+            break
+
+        # End of stage: expand S blossoms whose dual variable dropped to zero
+        for b in range(n, 2 * n):
+            if blossomparent[b] == -1 and blossombase[b] >= 0 and label[b] == 1 and dualvar[b] == 0:
+                expand_blossom(b, True)
+
+    return [endpoint[p] if p >= 0 else -1 for p in mate]
+
+def max_weight_matching(edges, max_cardinality=False):
+    """
+    Maximum-weight matching in a general (non-bipartite) graph.
+
+    Parameters:
+    edges: Iterable of (u, v, weight) triples with hashable vertices; self-loops are
+           ignored and for parallel edges only the heaviest one is kept
+    max_cardinality: If True, return the heaviest among maximum-cardinality matchings
+
+    Returns:
+    A dictionary representing the matching, where keys and values are matched vertices
+    """
+    graph = {}
+    for u, v, w in edges:
+        neighbors = graph.setdefault(u, {})
+        if v not in neighbors or w > neighbors[v]:
+            neighbors[v] = w
+
+    labels, _, weights = relabel_graph(graph, weighted=True)
+    mate = max_weight_matching_ids(len(labels), [(a, b, w) for (a, b), w in weights.items()],
+                                   max_cardinality)
+    return {labels[v]: labels[w] for v, w in enumerate(mate) if w != -1}
+
+if __name__ == "__main__":
+
+    edges = [
+        ('a', 'b', 6), ('a', 'c', 5), ('b', 'c', 4),
+        ('b', 'd', 8), ('c', 'e', 7), ('d', 'e', 3), ('d', 'f', 2), ('e', 'f', 9)
+    ]
+
+    matching = max_weight_matching(edges)
+    weights = {frozenset((u, v)): w for u, v, w in edges}
+    total = sum(weights[frozenset((u, v))] for u, v in matching.items() if str(u) < str(v))
+    print("Maximum weight matching:", matching)
+    print("Total weight:", total)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from matchings.auction import auction_assignment
+from matchings.hungarian import hungarian_shortest_path
+
+def test_single_column():
+    row_ind, col_ind, gap = auction_assignment([[3.0]])
+    assert row_ind.tolist() == [0] and col_ind.tolist() == [0]
+    assert gap == 0.0
+
+def test_integer_costs_are_exact():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        n = int(rng.integers(1, 20))
+        cost = rng.integers(0, 50, (n, n)).astype(float)
+        row_ind, col_ind, _ = auction_assignment(cost)
+        assert sorted(row_ind.tolist()) == list(range(n))
+        assert all(col_ind[row_ind[i]] == i for i in range(n))
+        expected, _ = hungarian_shortest_path(cost)
+        assert cost[np.arange(n), row_ind].sum() == cost[np.arange(n), expected].sum()
+
+def test_gap_bounds_distance_to_optimum_on_float_costs():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        n = int(rng.integers(1, 25))
+        cost = rng.random((n, n)) * rng.choice([1.0, 1000.0])
+        row_ind, _, gap = auction_assignment(cost)
+        expected, _ = hungarian_shortest_path(cost)
+        distance = cost[np.arange(n), row_ind].sum() - cost[np.arange(n), expected].sum()
+        assert -1e-9 <= distance <= gap + 1e-9
+        assert gap <= 1e-6 * (cost.max() - cost.min()) + 1e-9
+
+def test_two_workers_match_serial_run():
+    cost = np.random.default_rng(2).random((60, 60))
+    serial = auction_assignment(cost)
+    parallel = auction_assignment(cost, workers=2)
+    assert parallel[0].tolist() == serial[0].tolist()
+    assert parallel[2] == serial[2]
@@ -0,0 +1,68 @@
+import random
+
+from matchings.dynamic_matching import DynamicMatching
+from matchings.edmonds_blossom import edmonds_blossom
+
+def record_roots(dynamic):
+    # Wraps the instance's search so the test sees which roots every search used
+    calls = []
+    search = dynamic.search
+
+    def recording(roots):
+        calls.append(set(roots))
+        return search(roots)
+
+    dynamic.search = recording
+    return calls
+
+def test_insert_between_matched_vertices_searches_locally():
+    dynamic = DynamicMatching()
+    dynamic.insert_edge('p', 'a')
+    dynamic.insert_edge('b', 'q')
+    dynamic.insert_edge('x', 'p')
+    dynamic.insert_edge('q', 'y')
+    # A separate star with a matched centre and many free leaves
+    for leaf in range(50):
+        dynamic.insert_edge('c', leaf)
+    assert len(dynamic) == 3
+
+    calls = record_roots(dynamic)
+    assert dynamic.insert_edge('a', 'b')
+    assert len(dynamic) == 4
+    assert len(calls) == 1
+    assert {dynamic.labels[r] for r in calls[0]} <= {'x', 'y'}
+
+def test_insert_between_matched_vertices_without_free_side():
+    dynamic = DynamicMatching()
+    dynamic.insert_edge(0, 1)
+    dynamic.insert_edge(2, 3)
+    dynamic.insert_edge(4, 0)
+    calls = record_roots(dynamic)
+    # 3 has no alternating walk back to a free vertex, so no search is needed
+    assert not dynamic.insert_edge(1, 2)
+    assert calls == []
+    assert len(dynamic) == 2
+
+def test_random_updates_stay_maximum():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(2, 12)
+        dynamic = DynamicMatching()
+        edges = set()
+        for _ in range(40):
+            u, v = rng.sample(range(n), 2)
+            edge = (min(u, v), max(u, v))
+            if edge in edges and rng.random() < 0.5:
+                edges.remove(edge)
+                dynamic.delete_edge(*edge)
+            else:
+                edges.add(edge)
+                dynamic.insert_edge(*edge)
+            graph = {}
+            for a, b in edges:
+                graph.setdefault(a, []).append(b)
+                graph.setdefault(b, []).append(a)
+            matching = dynamic.matching()
+            for a, b in matching.items():
+                assert matching[b] == a and (min(a, b), max(a, b)) in edges
+            assert len(dynamic) == len(edmonds_blossom(graph)) // 2
@@ -0,0 +1,50 @@
+import random
+
+from matchings.edmonds_blossom import edmonds_blossom
+
+def graph_from_edges(edges):
+    graph = {}
+    for u, v in edges:
+        graph.setdefault(u, []).append(v)
+        graph.setdefault(v, []).append(u)
+    return graph
+
+def assert_valid_matching(graph, matching):
+    for u, v in matching.items():
+        assert matching[v] == u
+        assert v in graph[u]
+
+# Edge order decides the search order; in this order merging blossom members into the
+# union-find while the shrink walk was still running stopped the walk at a nested
+# blossom, and the matcher found 14 pairs instead of 15
+NESTED_BLOSSOM_EDGES = [
+    (11, 21), (11, 25), (1, 22), (12, 15), (13, 26), (8, 14), (3, 16), (12, 20), (7, 22),
+    (22, 23), (10, 26), (2, 5), (5, 24), (2, 27), (16, 21), (15, 20), (1, 27), (1, 10),
+    (7, 11), (1, 14), (4, 10), (7, 24), (7, 19), (5, 22), (25, 26), (6, 22), (6, 7),
+    (7, 20), (4, 17), (8, 19), (7, 14), (2, 22), (3, 17), (0, 29), (4, 6), (11, 18),
+    (22, 29), (2, 3), (9, 14), (13, 21), (18, 27), (7, 26), (13, 14), (17, 21), (3, 5),
+    (4, 12), (18, 22), (26, 29), (10, 22), (12, 21), (4, 7), (11, 23), (7, 29), (10, 13),
+    (5, 28), (2, 25), (8, 17)
+]
+
+def test_nested_blossom_on_shrink_path():
+    graph = graph_from_edges(NESTED_BLOSSOM_EDGES)
+    matching = edmonds_blossom(graph)
+    assert_valid_matching(graph, matching)
+    assert len(matching) // 2 == 15
+
+def test_nested_blossom_any_edge_order():
+    rng = random.Random(0)
+    edges = list(NESTED_BLOSSOM_EDGES)
+    for _ in range(500):
+        rng.shuffle(edges)
+        graph = graph_from_edges(edges)
+        matching = edmonds_blossom(graph)
+        assert_valid_matching(graph, matching)
+        assert len(matching) // 2 == 15
+
+def test_odd_cycle_with_stem():
+    graph = graph_from_edges([(0, 1), (1, 2), (2, 3), (3, 4), (4, 0), (4, 5)])
+    matching = edmonds_blossom(graph)
+    assert_valid_matching(graph, matching)
+    assert len(matching) // 2 == 3
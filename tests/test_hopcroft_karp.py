@@ -0,0 +1,17 @@
+import random
+
+from matchings.edmonds_blossom import edmonds_blossom
+from matchings.hopcroft_karp import hopcroft_karp
+
+def test_matches_general_matcher_on_random_bipartite_graphs():
+    rng = random.Random(0)
+    for _ in range(300):
+        n_left, n_right = rng.randint(1, 15), rng.randint(1, 15)
+        graph = {u: sorted({rng.randrange(n_right) for _ in range(rng.randint(0, 4))})
+                 for u in range(n_left)}
+        matching = hopcroft_karp(graph)
+        assert len(set(matching.values())) == len(matching)
+        assert all(v in graph[u] for u, v in matching.items())
+
+        general = {('L', u): [('R', v) for v in vs] for u, vs in graph.items()}
+        assert len(matching) == len(edmonds_blossom(general)) // 2
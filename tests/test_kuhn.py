@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from matchings.kuhn import CapacitatedStableMatching, gale_shapley_ids
+
+def test_complete_lists():
+    preferences_a = np.array([[0, 1], [0, 1]])
+    preferences_b = np.array([[1, 0], [0, 1]])
+    assert gale_shapley_ids(preferences_a, preferences_b).tolist() == [1, 0]
+
+def test_complete_size_lists_with_a_repeat_are_rejected():
+    # Receiver 0 lists proposer 0 twice and never proposer 1, but the lists still
+    # hold n_b x n_a entries in total
+    preferences_a = np.array([[0, 1], [0, 1]])
+    preferences_b = np.array([[0, 0], [0, 1]])
+    with pytest.raises(ValueError):
+        gale_shapley_ids(preferences_a, preferences_b)
+
+PREFERENCES_A = {'A1': ['B1', 'B2'], 'A2': ['B2', 'B1'], 'A3': ['B1', 'B2']}
+PREFERENCES_B = {'B1': ['A1', 'A2', 'A3'], 'B2': ['A2', 'A1', 'A3']}
+
+def test_new_proposer_with_receiver_ranks_matches_a_fresh_solve():
+    market = CapacitatedStableMatching(PREFERENCES_B, {'B1': 2}, PREFERENCES_A)
+    assert market.add_proposer('A4', ['B1', 'B2'], ranks_b={'B1': 0.5, 'B2': -1}) == 'B1'
+
+    # The same market with A4 listed at construction
+    preferences_b = {'B1': ['A1', 'A4', 'A2', 'A3'], 'B2': ['A4', 'A2', 'A1', 'A3']}
+    preferences_a = dict(PREFERENCES_A, A4=['B1', 'B2'])
+    fresh = CapacitatedStableMatching(preferences_b, {'B1': 2}, preferences_a)
+    assert market.matching() == fresh.matching()
+    assert market.admitted('B1') == fresh.admitted('B1')
+
+def test_new_proposer_nobody_ranks_is_rejected():
+    market = CapacitatedStableMatching(PREFERENCES_B, preferences_a=PREFERENCES_A)
+    with pytest.raises(ValueError):
+        market.add_proposer('A4', ['B1', 'B2'])
+    with pytest.raises(ValueError):
+        market.add_proposer('A4', ['B1'], ranks_b={'B9': 0})
+    assert 'A4' not in market.preferences_a
@@ -0,0 +1,29 @@
+from matchings.weighted_blossom import max_weight_matching, max_weight_matching_ids
+
+def nested_ears(depth):
+    # A triangle, then repeatedly a three-edge ear from the last ear back to vertex 0,
+    # so every new blossom contains the previous one; a light stem leaves one free
+    # vertex outside to augment from
+    edges = [(0, 1, 10), (1, 2, 10), (0, 2, 10)]
+    n, last = 3, 2
+    for _ in range(depth):
+        a, b = n, n + 1
+        n += 2
+        edges += [(last, a, 10), (a, b, 10), (b, 0, 10)]
+        last = b
+    edges.append((0, n, 1))
+    return n + 1, edges
+
+def test_deeply_nested_blossoms():
+    # Deeper than the default recursion limit of 1000
+    n, edges = nested_ears(1100)
+    mate = max_weight_matching_ids(n, edges, max_cardinality=True)
+    for v, w in enumerate(mate):
+        assert w == -1 or mate[w] == v
+    assert sum(1 for v, w in enumerate(mate) if w > v) == n // 2
+
+def test_labels_parallel_edges_and_self_loops():
+    # The heavier of two parallel edges counts, whichever way round it is given
+    edges = [('a', 'b', 1), ('b', 'a', 5), ('b', 'c', 4), ('c', 'c', 9), ('c', 'd', 2)]
+    assert max_weight_matching(edges) == {'a': 'b', 'b': 'a', 'c': 'd', 'd': 'c'}
+    assert max_weight_matching([('x', 'x', 3)]) == {}